@@ -3,11 +3,35 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
-from pathlib import Path
+import sys
+
+
+def _default_args(command: str) -> argparse.Namespace:
+    """Namespace matching the argparse defaults for a bare subcommand."""
+    return argparse.Namespace(
+        command=command,
+        project=".",
+        start_from_feature=None,
+        stop_after_feature=None,
+        dry_run=False,
+        model=None,
+        max_retries=None,
+        no_commit=False,
+        verbose=False,
+    )
 
 
 def main() -> None:
+    # Fast path: bare `orchestrate run` / `orchestrate status` (the common
+    # invocations) need no flag parsing, so skip parser construction.
+    if len(sys.argv) == 2 and sys.argv[1] in ("run", "status"):
+        args = _default_args(sys.argv[1])
+        if args.command == "run":
+            _run(args)
+        else:
+            _status(args)
+        return
+
     parser = argparse.ArgumentParser(
         prog="orchestrate",
         description="Claude Code orchestrator -- automated feature implementation",
@@ -75,6 +99,8 @@ def main() -> None:
 
 
 def _run(args: argparse.Namespace) -> None:
+    import asyncio
+
     from .config import load_config
     from .orchestrator import Orchestrator
 
@@ -101,6 +127,9 @@ def _run(args: argparse.Namespace) -> None:
 
 
 def _parse_spec(args: argparse.Namespace) -> None:
+    import asyncio
+    from pathlib import Path
+
     from .spec_parser import parse_spec
 
     spec_path = Path(args.spec_file).resolve()
@@ -112,6 +141,8 @@ def _parse_spec(args: argparse.Namespace) -> None:
 
 
 def _status(args: argparse.Namespace) -> None:
+    from pathlib import Path
+
     from .config import load_config
     from .state import StateManager
 
@@ -2,23 +2,22 @@
 
 from __future__ import annotations
 
-import sys
-
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
+import tomllib
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+_PERMISSION_MODES = frozenset({"default", "acceptEdits", "bypassPermissions"})
+_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
 
 
-class OrchestratorConfig(BaseModel):
+@dataclass(slots=True)
+class OrchestratorConfig:
     """All orchestrator settings. Loaded from defaults, then orchestrator.toml, then CLI flags."""
 
     # Project paths
-    project_dir: Path = Field(default_factory=lambda: Path.cwd())
+    project_dir: Path = field(default_factory=Path.cwd)
     spec_file: Path | None = None
     features_file: Path = Path("features.json")
     progress_file: Path = Path("progress.txt")
@@ -35,21 +34,26 @@ class OrchestratorConfig(BaseModel):
     max_budget_per_feature_usd: float | None = None
     stall_timeout_seconds: float = 300.0
     human_input_timeout_seconds: float = 120.0
+    max_parallel_features: int = 1
     start_from_feature: int | None = None
     stop_after_feature: int | None = None
     dry_run: bool = False
 
     # Permission and security
     permission_mode: Literal["default", "acceptEdits", "bypassPermissions"] = "acceptEdits"
-    allowed_tools: list[str] = Field(default_factory=lambda: [
+    allowed_tools: list[str] = field(default_factory=lambda: [
         "Read", "Write", "Edit", "Bash", "Glob", "Grep",
         "WebFetch", "WebSearch", "AskUserQuestion", "Task",
     ])
-    disallowed_tools: list[str] = Field(default_factory=list)
+    disallowed_tools: list[str] = field(default_factory=list)
     prompt_unknown_tools: bool = False  # If True, prompt for approval on unrecognized tools
+    # Frozenset mirror of disallowed_tools, built in __post_init__. The
+    # list stays list-shaped for TOML/SDK interchange; membership tests
+    # (the human-input auto-deny check) use this.
+    disallowed_tools_set: frozenset[str] = field(init=False, default=frozenset())
 
     # MCP servers
-    mcp_servers: dict[str, dict[str, Any]] = Field(default_factory=dict)
+    mcp_servers: dict[str, dict[str, Any]] = field(default_factory=dict)
 
     # Logging
     log_level: str = "INFO"
@@ -60,6 +64,36 @@ class OrchestratorConfig(BaseModel):
     auto_commit: bool = True
     commit_prefix: str = ""
 
+    def __post_init__(self) -> None:
+        # Coerce path fields (TOML values arrive as plain strings)
+        self.project_dir = Path(self.project_dir)
+        self.features_file = Path(self.features_file)
+        self.progress_file = Path(self.progress_file)
+        self.log_dir = Path(self.log_dir)
+        if self.spec_file is not None:
+            self.spec_file = Path(self.spec_file)
+        if self.init_script is not None:
+            self.init_script = Path(self.init_script)
+        if self.claude_md is not None:
+            self.claude_md = Path(self.claude_md)
+
+        self.disallowed_tools_set = frozenset(self.disallowed_tools)
+
+        if self.permission_mode not in _PERMISSION_MODES:
+            raise ValueError(
+                f"permission_mode must be one of {sorted(_PERMISSION_MODES)}, "
+                f"got {self.permission_mode!r}"
+            )
+        if self.log_level.upper() not in _LOG_LEVELS:
+            raise ValueError(f"invalid log_level: {self.log_level!r}")
+
+
+@lru_cache(maxsize=8)
+def _read_toml_cached(toml_path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a TOML file, cached on (path, mtime) so unchanged files parse once."""
+    with open(toml_path, "rb") as f:
+        return tomllib.load(f)
+
 
 def load_config(cli_args: dict[str, Any]) -> OrchestratorConfig:
     """Load config from defaults → orchestrator.toml → CLI args."""
@@ -69,11 +103,13 @@ def load_config(cli_args: dict[str, Any]) -> OrchestratorConfig:
     # Start with defaults
     config_data: dict[str, Any] = {"project_dir": project_dir}
 
-    # Layer in TOML if present
-    if toml_path.exists():
-        with open(toml_path, "rb") as f:
-            toml_data = tomllib.load(f)
-        config_data.update(toml_data)
+    # Layer in TOML if present (single stat; the mtime keys the parse cache)
+    try:
+        mtime_ns = toml_path.stat().st_mtime_ns
+    except OSError:
+        pass
+    else:
+        config_data.update(_read_toml_cached(str(toml_path), mtime_ns))
 
     # Layer in CLI overrides (only non-None values)
     for key, value in cli_args.items():
@@ -83,4 +119,8 @@ def load_config(cli_args: dict[str, Any]) -> OrchestratorConfig:
     # Ensure project_dir is always set
     config_data["project_dir"] = project_dir
 
-    return OrchestratorConfig(**config_data)
+    # Drop unrecognized keys (pydantic used to ignore extras; keep that behavior)
+    known_fields = {f.name for f in fields(OrchestratorConfig)}
+    return OrchestratorConfig(
+        **{k: v for k, v in config_data.items() if k in known_fields}
+    )
@@ -2,13 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import re
+import sys
 import time
+from collections import deque
 from typing import Any
 
+from .logging_config import flush_log_handlers
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator — plain substring scan still works
+    ahocorasick = None
+
+try:
+    import re2  # google-re2: linear-time DFA matching, immune to backtracking
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger("orchestrator")
 
+# Activity timestamps only feed stall detection (hundreds-of-seconds
+# granularity), so the coarse monotonic clock is plenty: it reads a cached
+# kernel value instead of taking the full vDSO clock path. Not available on
+# every platform (e.g. macOS), hence the fallback to time.monotonic.
+try:
+    _CLOCK_COARSE = time.CLOCK_MONOTONIC_COARSE
+
+    def _now() -> float:
+        return time.clock_gettime(_CLOCK_COARSE)
+except AttributeError:  # pragma: no cover - platform without coarse clock
+    _now = time.monotonic
+
+# Interned sentinels for the per-event dispatch in security_hook. Interning
+# makes the (frequent) equality checks resolve via pointer comparison when
+# the SDK hands us interned strings; == stays correct either way.
+_EVT_PRE_TOOL_USE = sys.intern("PreToolUse")
+_TOOL_BASH = sys.intern("Bash")
+
 # ---------------------------------------------------------------------------
 # Bash command security rules
 #
@@ -21,7 +55,7 @@ logger = logging.getLogger("orchestrator")
 # Organized by threat category. Each entry is (pattern, reason).
 # ---------------------------------------------------------------------------
 
-BLOCKED_SUBSTRINGS: list[tuple[str, str]] = [
+BLOCKED_SUBSTRINGS: tuple[tuple[str, str], ...] = (
     # --- Destructive system commands ---
     ("mkfs.", "filesystem format"),
     (":(){:|:&};:", "fork bomb"),
@@ -58,51 +92,130 @@ BLOCKED_SUBSTRINGS: list[tuple[str, str]] = [
     # --- Credential / secret exposure ---
     ("--password", "password in command line"),
     ("--token", "token in command line"),
-]
-
-BLOCKED_PATTERNS: list[tuple[re.Pattern[str], str]] = [
-    # --- Arbitrary code execution from internet ---
-    (
-        re.compile(r"\bcurl\b.*\|\s*(sh|bash|zsh|python|node)\b"),
-        "piping curl output to interpreter",
-    ),
-    (
-        re.compile(r"\bwget\b.*\|\s*(sh|bash|zsh|python|node)\b"),
-        "piping wget output to interpreter",
-    ),
-    (
-        re.compile(r"\beval\b.*\$\(\s*(curl|wget)\b"),
-        "eval of downloaded content",
-    ),
-
-    # --- sudo (shouldn't be needed for web dev) ---
-    (
-        re.compile(r"\bsudo\b"),
-        "sudo (not needed for project builds)",
-    ),
-
-    # --- chmod making files world-writable ---
-    (
-        re.compile(r"\bchmod\s+([0-7]*7[0-7]{0,2}|a\+w|o\+w|\+w)"),
-        "chmod world-writable",
-    ),
-
-    # --- Docker / k8s destructive operations ---
-    (
-        re.compile(r"\bdocker\s+(rm|rmi|system\s+prune)"),
-        "docker destructive operation",
-    ),
-    (
-        re.compile(r"\bkubectl\s+delete\b"),
-        "kubectl delete",
-    ),
-
-    # --- Database destructive (in case of embedded sqlite, etc.) ---
-    (
-        re.compile(r"\b(DROP\s+(TABLE|DATABASE|SCHEMA)|TRUNCATE\s+TABLE)\b", re.IGNORECASE),
-        "destructive SQL operation",
-    ),
-]
+)
+
+
+def _build_patterns() -> tuple[tuple[re.Pattern[str], str], ...]:
+    """Compile the regex rule tuple. Called lazily via __getattr__ (PEP 562)."""
+    return (
+        # --- Arbitrary code execution from internet ---
+        (
+            re.compile(r"\bcurl\b.*\|\s*(sh|bash|zsh|python|node)\b"),
+            "piping curl output to interpreter",
+        ),
+        (
+            re.compile(r"\bwget\b.*\|\s*(sh|bash|zsh|python|node)\b"),
+            "piping wget output to interpreter",
+        ),
+        (
+            re.compile(r"\beval\b.*\$\(\s*(curl|wget)\b"),
+            "eval of downloaded content",
+        ),
+
+        # --- sudo (shouldn't be needed for web dev) ---
+        (
+            re.compile(r"\bsudo\b"),
+            "sudo (not needed for project builds)",
+        ),
+
+        # --- chmod making files world-writable ---
+        (
+            re.compile(r"\bchmod\s+([0-7]*7[0-7]{0,2}|a\+w|o\+w|\+w)"),
+            "chmod world-writable",
+        ),
+
+        # --- Docker / k8s destructive operations ---
+        (
+            re.compile(r"\bdocker\s+(rm|rmi|system\s+prune)"),
+            "docker destructive operation",
+        ),
+        (
+            re.compile(r"\bkubectl\s+delete\b"),
+            "kubectl delete",
+        ),
+
+        # --- Database destructive (in case of embedded sqlite, etc.) ---
+        # Case-insensitivity is scoped inline so the pattern fuses into the
+        # single no-flags alternation built in _compile_rules.
+        (
+            re.compile(r"(?i:\b(DROP\s+(TABLE|DATABASE|SCHEMA)|TRUNCATE\s+TABLE)\b)"),
+            "destructive SQL operation",
+        ),
+    )
+
+
+# Lazily-built rule state. Regex compilation and automaton construction are
+# deferred to the first check_command_safety call so that importing this
+# module stays cheap (import time is user-visible CLI startup latency).
+# re.Pattern or re2 pattern depending on what is installed; both expose the
+# finditer/groupdict API used below. _FUSED_BLOCKED_NO_RM is the same
+# alternation without the rm branch; see check_command_safety.
+_FUSED_BLOCKED: Any = None
+_FUSED_BLOCKED_NO_RM: Any = None
+_PATTERN_REASONS: tuple[str, ...] = ()
+_SUBSTRING_AUTOMATON: Any = None
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: materialize BLOCKED_PATTERNS on first attribute access.
+    if name == "BLOCKED_PATTERNS":
+        patterns = globals()[name] = _build_patterns()
+        return patterns
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _compile_fused(source: str) -> Any:
+    """Compile a fused alternation, preferring google-re2 when available.
+
+    Several rules have .* in the middle, which a backtracking engine can
+    blow up on for adversarial commands; RE2's DFA guarantees linear time.
+    The rules avoid backreferences and lookaround, so they compile under
+    both engines.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(source)
+        except re2.error:
+            pass
+    return re.compile(source)
+
+
+def _compile_rules() -> None:
+    """Build the fused regex and substring automaton on first use.
+
+    The fused alternation gives the hot path a single C-level scan instead
+    of one .search() per pattern. Each branch is a named group ("b<index>")
+    mapping back into _PATTERN_REASONS; the recursive-rm detector rides
+    along as the "rm" group so its Python-level argument parsing only runs
+    when a recursive rm is actually present.
+    """
+    global _FUSED_BLOCKED, _FUSED_BLOCKED_NO_RM
+    global _PATTERN_REASONS, _SUBSTRING_AUTOMATON
+
+    patterns = globals().get("BLOCKED_PATTERNS")
+    if patterns is None:
+        patterns = globals()["BLOCKED_PATTERNS"] = _build_patterns()
+
+    _PATTERN_REASONS = tuple(reason for _, reason in patterns)
+    branches = [f"(?P<b{i}>{p.pattern})" for i, (p, _) in enumerate(patterns)]
+    _FUSED_BLOCKED = _compile_fused(
+        "|".join(branches + [r"(?P<rm>\brm\s+.*-[a-zA-Z]*[rR])"])
+    )
+    # The rm branch is greedy and can swallow the rest of the command, so
+    # an allowlisted rm triggers a rescan with this rm-free alternation
+    # (see check_command_safety).
+    _FUSED_BLOCKED_NO_RM = _compile_fused("|".join(branches))
+
+    # Aho-Corasick automaton over BLOCKED_SUBSTRINGS: one linear pass over
+    # the command instead of one substring scan per entry. Stays None when
+    # pyahocorasick is not installed; the plain loop is used instead.
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for substring, reason in BLOCKED_SUBSTRINGS:
+            automaton.add_word(substring, reason)
+        automaton.make_automaton()
+        _SUBSTRING_AUTOMATON = automaton
+
 
 # ---------------------------------------------------------------------------
 # Recursive rm: allowlist approach
@@ -112,12 +225,9 @@ BLOCKED_PATTERNS: list[tuple[re.Pattern[str], str]] = [
 # Add entries here as needed for your project's build artifacts.
 # ---------------------------------------------------------------------------
 
-# Detects rm with a recursive flag: -r, -rf, -fr, -Rf, etc.
-_RM_RECURSIVE_RE = re.compile(r"\brm\s+.*-[a-zA-Z]*[rR]")
-
 # Basenames (not paths) that are safe to recursively delete.
 # Matched against each argument after the flags.
-RM_RECURSIVE_ALLOWLIST: set[str] = {
+RM_RECURSIVE_ALLOWLIST: frozenset[str] = frozenset({
     # JS/Node build artifacts
     "node_modules",
     "dist",
@@ -142,21 +252,43 @@ RM_RECURSIVE_ALLOWLIST: set[str] = {
     # Misc
     "tmp",
     ".tmp",
-}
+})
+
+
+# Strips any run of leading "./" prefixes and trailing slashes in one pass.
+# str.lstrip("./") would be wrong here — it strips any mix of "." and "/"
+# characters, mangling names like "..".
+_NORM_RE = re.compile(r"^(?:\./)+|/+$")
+
+
+# Double-quoted span, single-quoted span, or a bare run of non-space.
+_TOKEN_RE = re.compile(r'''"[^"]*"|'[^']*'|\S+''')
+
+
+@functools.lru_cache(maxsize=256)
+def _tokenize(command: str) -> tuple[str, ...]:
+    """Memoized tokenization via one regex pass.
+
+    Covers the grammar the rm checker needs — quoted arguments stay
+    single tokens with the quotes stripped — without shlex's pure-Python
+    state machine. A dangling quote simply stays attached to its token,
+    which then fails the allowlist lookup (conservative).
+    """
+    return tuple(
+        t[1:-1] if len(t) > 1 and t[0] in "\"'" and t[-1] == t[0] else t
+        for t in _TOKEN_RE.findall(command)
+    )
 
 
 def _check_rm_recursive(command: str) -> str | None:
     """Block all recursive rm unless every target is in the allowlist.
 
+    Only called when the fused regex has already detected a recursive rm.
     Parses the arguments after `rm` and its flags, strips leading `./`
     and trailing `/`, then checks each basename against RM_RECURSIVE_ALLOWLIST.
     """
-    if not _RM_RECURSIVE_RE.search(command):
-        return None
-
-    # Extract everything after "rm" and its flags
-    # Split the command into tokens (simple split, not shell-aware)
-    tokens = command.split()
+    # Quote-aware tokenization so quoted targets are parsed correctly
+    tokens = _tokenize(command)
     try:
         rm_idx = tokens.index("rm")
     except ValueError:
@@ -170,10 +302,7 @@ def _check_rm_recursive(command: str) -> str | None:
         if token.startswith("-"):
             continue
         # Normalize: strip leading "./" prefix and trailing "/"
-        cleaned = token
-        while cleaned.startswith("./"):
-            cleaned = cleaned[2:]
-        cleaned = cleaned.rstrip("/")
+        cleaned = _NORM_RE.sub("", token)
         if not cleaned or cleaned in (".", ".."):
             # Bare ".", "..", "/" — definitely block
             return "recursive rm targeting root or current directory"
@@ -191,23 +320,68 @@ def _check_rm_recursive(command: str) -> str | None:
     return None
 
 
+# Exact known-safe commands, short-circuited before any rule machinery
+# (and before its lazy compilation). EXACT matches only — a prefix match
+# would wave through compounds like "git status; rm -rf /".
+_FAST_SAFE_COMMANDS: frozenset[str] = frozenset({
+    "git status",
+    "git diff",
+    "git log",
+    "git stash",
+    "git stash pop",
+    "git branch -a",
+    "ls",
+    "ls -la",
+    "pwd",
+})
+
+
+@functools.lru_cache(maxsize=512)
 def check_command_safety(command: str) -> str | None:
     """Check a Bash command against security rules.
 
     Returns None if the command is safe, or a reason string if blocked.
+    The result is memoized: verdicts depend only on the command string, and
+    sessions re-run the same build/test/git commands constantly.
     """
-    for pattern, reason in BLOCKED_SUBSTRINGS:
-        if pattern in command:
-            return reason
+    if command in _FAST_SAFE_COMMANDS:
+        return None
 
-    for regex, reason in BLOCKED_PATTERNS:
-        if regex.search(command):
+    if _FUSED_BLOCKED is None:
+        _compile_rules()
+
+    if _SUBSTRING_AUTOMATON is not None:
+        for _, reason in _SUBSTRING_AUTOMATON.iter(command):
             return reason
+    else:
+        for pattern, reason in BLOCKED_SUBSTRINGS:
+            if pattern in command:
+                return reason
 
-    # Allowlist-based recursive rm check (runs last since it's more expensive)
-    rm_reason = _check_rm_recursive(command)
-    if rm_reason:
-        return rm_reason
+    m = _FUSED_BLOCKED.search(command)
+    if m is None:
+        return None
+    for group_name, matched in m.groupdict().items():
+        if matched is None:
+            continue
+        if group_name == "rm":
+            # Recursive rm detected — run the allowlist parse.
+            rm_reason = _check_rm_recursive(command)
+            if rm_reason:
+                return rm_reason
+            # The greedy rm branch may have swallowed the rest of the
+            # command, so resuming the fused scan after it would skip any
+            # pattern inside that span (e.g. "rm -rf dist -x;sudo ...").
+            # Rescan the whole command with the rm-free alternation so an
+            # allowlisted rm can never mask another blocked pattern.
+            m = _FUSED_BLOCKED_NO_RM.search(command)
+            if m is None:
+                return None
+            for g, v in m.groupdict().items():
+                if v is not None:
+                    return _PATTERN_REASONS[int(g[1:])]
+            return None
+        return _PATTERN_REASONS[int(group_name[1:])]
 
     return None
 
@@ -215,11 +389,85 @@ def check_command_safety(command: str) -> str | None:
 class OrchestratorHooks:
     """Hook callbacks for security, activity tracking, and logging."""
 
-    def __init__(self, stall_timeout: float = 300.0):
+    __slots__ = (
+        "stall_timeout",
+        "max_log_entries",
+        "activity_event",
+        "_last_tool_time",
+        "_tool_count",
+        "_tool_names",
+        "_tool_times",
+    )
+
+    def __init__(self, stall_timeout: float = 300.0, max_log_entries: int = 4096):
         self.stall_timeout = stall_timeout
-        self._last_tool_time = time.monotonic()
+        self.max_log_entries = max_log_entries
+        # Pulsed (set then cleared) on every tool event so a stall detector
+        # can await activity instead of polling.
+        self.activity_event = asyncio.Event()
+        self._last_tool_time = _now()
         self._tool_count = 0
-        self._tool_log: list[dict[str, Any]] = []
+        # Ring buffers in struct-of-arrays layout: parallel name/time
+        # sequences instead of one dict allocation per tool event. Kept the
+        # same length so index i is one event; bounded so long sessions
+        # don't accumulate memory.
+        self._tool_names: deque[str] = deque(maxlen=max_log_entries)
+        self._tool_times: deque[float] = deque(maxlen=max_log_entries)
+
+    # --- Fused PreToolUse hook ---
+
+    async def pre_tool_use(
+        self,
+        input_data: dict[str, Any],
+        tool_use_id: str | None,
+        context: Any,
+    ) -> dict[str, Any]:
+        """Single PreToolUse callback: keepalive + security + activity.
+
+        The SDK schedules one coroutine per registered hook per tool call,
+        so fusing the three concerns into one callback cuts the per-call
+        scheduling to a third. The individual hooks below remain for tests
+        and direct use; this is the one registered with the SDK.
+        """
+        # Activity tracking (every tool)
+        now = _now()
+        self._last_tool_time = now
+        self._tool_count += 1
+        # Pulse: wake any stall detector awaiting activity, then re-arm.
+        self.activity_event.set()
+        self.activity_event.clear()
+        try:
+            tool_name = input_data["tool_name"]
+        except KeyError:
+            tool_name = "unknown"
+        self._tool_names.append(tool_name)
+        self._tool_times.append(now)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Hook: tool #%d: %s", self._tool_count, tool_name)
+
+        # Security check (Bash only)
+        if tool_name == _TOOL_BASH:
+            try:
+                command = input_data["tool_input"]["command"]
+            except (KeyError, TypeError):
+                return {"continue_": True}
+            reason = check_command_safety(command)
+            if reason:
+                logger.warning(f"BLOCKED: {reason} — {command}")
+                return {
+                    "continue_": True,
+                    "hookSpecificOutput": {
+                        "hookEventName": "PreToolUse",
+                        "permissionDecision": "deny",
+                        "permissionDecisionReason": (
+                            f"Blocked by orchestrator security policy: {reason}"
+                        ),
+                    },
+                }
+
+        # Keepalive: the Python SDK requires a PreToolUse hook returning
+        # {"continue_": True} for can_use_tool to function.
+        return {"continue_": True}
 
     # --- Required dummy hook for Python SDK can_use_tool workaround ---
 
@@ -250,12 +498,18 @@ class OrchestratorHooks:
         BLOCKED_PATTERNS (regex) covering: filesystem destruction, git push,
         arbitrary code execution, package publishing, sudo, and more.
         """
-        if input_data.get("hook_event_name") != "PreToolUse":
+        get = input_data.get
+        if get("hook_event_name") != _EVT_PRE_TOOL_USE:
             return {}
-        if input_data.get("tool_name") != "Bash":
+        if get("tool_name") != _TOOL_BASH:
             return {}
 
-        command = input_data.get("tool_input", {}).get("command", "")
+        # EAFP: the happy path skips the default-dict allocations of
+        # chained .get(..., {}) calls.
+        try:
+            command = input_data["tool_input"]["command"]
+        except (KeyError, TypeError):
+            return {}
         reason = check_command_safety(command)
         if reason:
             logger.warning(f"BLOCKED: {reason} — {command}")
@@ -279,15 +533,19 @@ class OrchestratorHooks:
         context: Any,
     ) -> dict[str, Any]:
         """Track tool activity timestamps for stall detection."""
-        self._last_tool_time = time.monotonic()
+        self._last_tool_time = _now()
         self._tool_count += 1
-
-        tool_name = input_data.get("tool_name", "unknown")
-        self._tool_log.append({
-            "tool": tool_name,
-            "time": self._last_tool_time,
-        })
-        logger.debug(f"  Hook: tool #{self._tool_count}: {tool_name}")
+        self.activity_event.set()
+        self.activity_event.clear()
+
+        try:
+            tool_name = input_data["tool_name"]
+        except KeyError:
+            tool_name = "unknown"
+        self._tool_names.append(tool_name)
+        self._tool_times.append(self._last_tool_time)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Hook: tool #%d: %s", self._tool_count, tool_name)
         return {}
 
     # --- Post-tool logging ---
@@ -299,10 +557,17 @@ class OrchestratorHooks:
         context: Any,
     ) -> dict[str, Any]:
         """Log tool results, highlighting errors."""
-        tool_name = input_data.get("tool_name", "unknown")
         response = input_data.get("tool_response", "")
-        if isinstance(response, dict) and response.get("is_error"):
-            logger.warning(f"Tool {tool_name} error: {str(response)[:500]}")
+        is_error = isinstance(response, dict) and response.get("is_error")
+        if is_error and logger.isEnabledFor(logging.WARNING):
+            tool_name = input_data.get("tool_name", "unknown")
+            # Stringifying a large nested response just to truncate it is
+            # O(size of response); summarize big dicts by their keys instead.
+            if len(response) < 32:
+                detail = repr(response)[:500]
+            else:
+                detail = f"<{len(response)} keys: {sorted(response)[:16]}>"
+            logger.warning("Tool %s error: %s", tool_name, detail)
         return {}
 
     # --- Stop hook ---
@@ -315,13 +580,15 @@ class OrchestratorHooks:
     ) -> dict[str, Any]:
         """Log session completion stats."""
         logger.info(f"Session stopping. Tools used: {self._tool_count}")
+        # Session boundary — push buffered structured-log records to disk.
+        flush_log_handlers()
         return {}
 
     # --- Stall detection properties ---
 
     @property
     def seconds_since_last_activity(self) -> float:
-        return time.monotonic() - self._last_tool_time
+        return _now() - self._last_tool_time
 
     @property
     def is_stalled(self) -> bool:
@@ -329,6 +596,8 @@ class OrchestratorHooks:
 
     def reset(self) -> None:
         """Reset counters for a new feature session."""
-        self._last_tool_time = time.monotonic()
+        self._last_tool_time = _now()
         self._tool_count = 0
-        self._tool_log.clear()
+        self._tool_names.clear()
+        self._tool_times.clear()
+        self.activity_event.clear()
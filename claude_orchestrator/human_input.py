@@ -4,16 +4,40 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+import sys
+from typing import TYPE_CHECKING, Any
 
-from claude_agent_sdk.types import (
-    PermissionResultAllow,
-    PermissionResultDeny,
-    ToolPermissionContext,
-)
+if TYPE_CHECKING:
+    from claude_agent_sdk.types import (
+        PermissionResultAllow,
+        PermissionResultDeny,
+        ToolPermissionContext,
+    )
 
 logger = logging.getLogger("orchestrator")
 
+# The SDK types are imported lazily: claude_agent_sdk.types drags in the
+# whole SDK (a large transitive import chain), which code that only needs
+# this module's class definitions should not pay for. _load_sdk_types
+# populates these globals on first handler construction.
+PermissionResultAllow: Any = None
+PermissionResultDeny: Any = None
+
+# Shared allow result for the (overwhelmingly common) unchanged-input case.
+# The SDK substitutes the original input when updated_input is None, so one
+# immutable instance serves every plain approval with zero allocation.
+_ALLOW_UNCHANGED: Any = None
+
+
+def _load_sdk_types() -> None:
+    global PermissionResultAllow, PermissionResultDeny, _ALLOW_UNCHANGED
+    if PermissionResultAllow is None:
+        from claude_agent_sdk import types as _sdk_types
+
+        PermissionResultAllow = _sdk_types.PermissionResultAllow
+        PermissionResultDeny = _sdk_types.PermissionResultDeny
+        _ALLOW_UNCHANGED = PermissionResultAllow()
+
 
 class HumanInputHandler:
     """Handles AskUserQuestion and tool approval with timeout escalation.
@@ -23,12 +47,14 @@ class HumanInputHandler:
     Only truly unknown tools or explicitly denied tools require human approval.
     """
 
-    # Tools that are always safe to auto-approve
-    STANDARD_TOOLS = {
+    # Tools that are always safe to auto-approve. Frozen and interned: these
+    # names are membership-tested on every tool invocation, and interning
+    # lets the common lookups resolve by pointer comparison.
+    STANDARD_TOOLS = frozenset(map(sys.intern, (
         "Read", "Glob", "Grep", "WebSearch", "WebFetch",
         "Write", "Edit", "Bash", "Task", "TodoWrite", "TodoRead",
         "NotebookEdit", "Skill",
-    }
+    )))
 
     def __init__(
         self,
@@ -37,10 +63,18 @@ class HumanInputHandler:
         auto_deny_tools: set[str] | None = None,
         prompt_unknown_tools: bool = False,
     ):
+        _load_sdk_types()
         self.input_timeout = input_timeout
-        self.auto_approve_tools = auto_approve_tools or self.STANDARD_TOOLS
-        self.auto_deny_tools = auto_deny_tools or set()
+        self.auto_approve_tools = (
+            frozenset(map(sys.intern, auto_approve_tools))
+            if auto_approve_tools
+            else self.STANDARD_TOOLS
+        )
+        self.auto_deny_tools = frozenset(map(sys.intern, auto_deny_tools or ()))
         self.prompt_unknown_tools = prompt_unknown_tools
+        # Deny results are deterministic per tool name; cache them so
+        # repeated denials of the same tool reuse one object.
+        self._deny_cache: dict[str, PermissionResultDeny] = {}
 
     async def can_use_tool(
         self,
@@ -61,21 +95,26 @@ class HumanInputHandler:
             return await self._handle_ask_user_question(input_data)
 
         if tool_name in self.auto_deny_tools:
-            return PermissionResultDeny(
-                message=f"Tool {tool_name} is not permitted by orchestrator policy"
-            )
+            deny = self._deny_cache.get(tool_name)
+            if deny is None:
+                deny = self._deny_cache[tool_name] = PermissionResultDeny(
+                    message=f"Tool {tool_name} is not permitted by orchestrator policy"
+                )
+            return deny
 
         if tool_name in self.auto_approve_tools:
-            return PermissionResultAllow(updated_input=input_data)
+            return _ALLOW_UNCHANGED
 
-        # MCP tools (e.g. mcp__playwright__browser_navigate) — auto-approve
-        if tool_name.startswith("mcp__"):
-            return PermissionResultAllow(updated_input=input_data)
+        # MCP tools (e.g. mcp__playwright__browser_navigate) — auto-approve.
+        # Slice compare avoids the startswith method-call overhead for a
+        # fixed 5-char literal.
+        if tool_name[:5] == "mcp__":
+            return _ALLOW_UNCHANGED
 
         # Unknown tool — either auto-approve or prompt based on config
         if not self.prompt_unknown_tools:
-            logger.debug(f"Auto-approving unknown tool: {tool_name}")
-            return PermissionResultAllow(updated_input=input_data)
+            logger.debug("Auto-approving unknown tool: %s", tool_name)
+            return _ALLOW_UNCHANGED
 
         return await self._prompt_tool_approval(tool_name, input_data)
 
@@ -144,7 +183,7 @@ class HumanInputHandler:
                 timeout=self.input_timeout,
             )
             if response.strip().lower() in ("y", "yes"):
-                return PermissionResultAllow(updated_input=input_data)
+                return _ALLOW_UNCHANGED
             else:
                 return PermissionResultDeny(message="User denied this operation")
         except asyncio.TimeoutError:
@@ -156,8 +195,10 @@ class HumanInputHandler:
 
 async def _async_input(prompt: str) -> str:
     """Non-blocking input that works with asyncio."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, lambda: input(prompt))
+    # to_thread passes input straight through (no per-call lambda) and uses
+    # the running loop's default executor without the deprecated
+    # get_event_loop lookup.
+    return await asyncio.to_thread(input, prompt)
 
 
 def _parse_response(response: str, options: list[dict[str, Any]]) -> str:
@@ -2,29 +2,111 @@
 
 from __future__ import annotations
 
-import json
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    import json
+
+    def _dumps(obj: dict) -> str:
+        return json.dumps(obj)
+
 if TYPE_CHECKING:
     from .config import OrchestratorConfig
 
+# Memory handlers created by setup_logger, so flush_log_handlers can force
+# buffered records to disk (atexit, and at session boundaries via stop_hook).
+_memory_handlers: list[logging.handlers.MemoryHandler] = []
+
+# Queue listeners (background writer threads) to stop at process exit.
+# Stopping a listener drains its queue before the thread terminates.
+_queue_listeners: list[logging.handlers.QueueListener] = []
+
+# One run id per process, computed at import: every log file from this
+# process shares it, so there is no per-init datetime allocation.
+_RUN_ID = time.strftime("%Y%m%d-%H%M%S")
+
 
 class JSONFormatter(logging.Formatter):
-    """JSON Lines format for structured log files."""
+    """JSON Lines format for structured log files.
+
+    Timestamps are emitted as the raw float epoch (record.created): no
+    datetime allocation or isoformat call per record; readers format on
+    demand.
+    """
 
     def format(self, record: logging.LogRecord) -> str:
-        return json.dumps({
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+        return _dumps({
+            "timestamp": record.created,
             "level": record.levelname,
             "message": record.getMessage(),
             "module": record.module,
         })
 
 
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler with a large write buffer and no per-record flush.
+
+    The stock StreamHandler flushes after every emit, which costs one
+    write() syscall per log line. Records reach this handler in batches
+    (via MemoryHandler below), so flushing is deferred to the 64 KiB io
+    buffer, force_flush(), or close().
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=64 * 1024,
+                    encoding=self.encoding)
+
+    def flush(self) -> None:
+        # Deliberate no-op: see class docstring. close() still flushes via
+        # the underlying stream's close.
+        pass
+
+    def force_flush(self) -> None:
+        if self.stream:
+            self.stream.flush()
+
+
+class _FlushingMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler whose flush also drains the target's io buffer.
+
+    Plain MemoryHandler.flush only hands records to the target; with the
+    buffered file handler above those bytes would otherwise sit in its
+    64 KiB buffer past a WARNING-triggered flush.
+    """
+
+    def flush(self) -> None:
+        super().flush()
+        target = self.target
+        if isinstance(target, _BufferedFileHandler):
+            target.force_flush()
+
+
+def flush_log_handlers() -> None:
+    """Flush buffered log records (and their file buffers) to disk."""
+    for handler in _memory_handlers:
+        handler.flush()
+
+
+def _shutdown_logging() -> None:
+    """atexit: drain queue listeners, then flush remaining buffers."""
+    for listener in _queue_listeners:
+        listener.stop()
+    _queue_listeners.clear()
+    flush_log_handlers()
+
+
 def setup_logger(config: OrchestratorConfig) -> logging.Logger:
     """Create a logger with console and optional JSON-lines file handlers."""
     logger = logging.getLogger("orchestrator")
@@ -42,13 +124,35 @@ def setup_logger(config: OrchestratorConfig) -> logging.Logger:
     ))
     logger.addHandler(console)
 
-    # File handler (JSON lines)
+    # File handler (JSON lines). Log calls from hook coroutines only enqueue
+    # the record (QueueHandler); a dedicated QueueListener thread formats and
+    # writes, so the event loop never blocks on disk. On that thread, records
+    # are batched in memory so bulk debug/info traffic collapses into grouped
+    # writes; WARNING and above flush immediately so problems are never
+    # stuck in the buffer.
     if config.structured_log:
         log_dir = config.project_dir / config.log_dir
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_file = log_dir / f"run-{datetime.now().strftime('%Y%m%d-%H%M%S')}.jsonl"
-        file_handler = logging.FileHandler(log_file)
+        # One stat() beats an unconditional mkdir + EEXIST swallow once the
+        # directory exists (every init after the first).
+        if not log_dir.is_dir():
+            log_dir.mkdir(parents=True, exist_ok=True)
+        log_file = log_dir / f"run-{_RUN_ID}.jsonl"
+        file_handler = _BufferedFileHandler(log_file)
         file_handler.setFormatter(JSONFormatter())
-        logger.addHandler(file_handler)
+        memory_handler = _FlushingMemoryHandler(
+            capacity=512,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, memory_handler, respect_handler_level=True,
+        )
+        listener.start()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _memory_handlers.append(memory_handler)
+        _queue_listeners.append(listener)
+        atexit.register(_shutdown_logging)
 
     return logger
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class FeatureStatus(str, Enum):
@@ -23,6 +24,11 @@ class Feature(BaseModel):
     name: str
     passes: bool = False
     steps: list[str] = Field(default_factory=list)
+    # Ids of features that must pass before this one may start; empty means
+    # no ordering constraint. Enforced by the parallel scheduler only: the
+    # sequential loop runs features in list order and assumes any
+    # dependencies appear earlier in the list.
+    depends_on: list[int] = Field(default_factory=list)
     status: FeatureStatus = FeatureStatus.PENDING
     attempts: int = 0
     last_error: str | None = None
@@ -44,9 +50,19 @@ class FeatureResult(BaseModel):
 
 
 class ProgressEntry(BaseModel):
-    """A single entry in the progress log."""
+    """A single entry in the progress log.
 
-    timestamp: datetime
+    Frozen: entries are write-once records, and freezing lets pydantic skip
+    per-assignment validation machinery. Feature and FeatureResult stay
+    mutable — the orchestrator updates them in place during retries.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    # Stored as a float epoch rather than a datetime: thousands of entries
+    # accumulate over a run, and a float is a third the size with no tz
+    # baggage. Render ISO lazily via timestamp_iso when displaying.
+    timestamp: float = Field(default_factory=time.time)
     feature_id: int
     feature_name: str
     status: FeatureStatus
@@ -54,3 +70,15 @@ class ProgressEntry(BaseModel):
     commit_hash: str | None = None
     session_id: str | None = None
     error: str | None = None
+
+    @field_validator("timestamp", mode="before")
+    @classmethod
+    def _coerce_timestamp(cls, value: object) -> object:
+        # Callers historically passed datetime objects; accept both.
+        if isinstance(value, datetime):
+            return value.timestamp()
+        return value
+
+    @property
+    def timestamp_iso(self) -> str:
+        return datetime.fromtimestamp(self.timestamp).isoformat()
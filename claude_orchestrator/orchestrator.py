@@ -3,18 +3,80 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import os
+import re
 import signal
-from datetime import datetime
+import sys
 from typing import TYPE_CHECKING
 
 from .logging_config import setup_logger
-from .models import Feature, FeatureResult, FeatureStatus, ProgressEntry
+from .models import Feature, FeatureResult, FeatureStatus
 from .runner import FeatureRunner
 from .state import StateManager
 
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator — the fused regex still works
+    ahocorasick = None
+
 if TYPE_CHECKING:
     from .config import OrchestratorConfig
 
+# Errors matching any of these never warrant a retry. Fused into one
+# compiled alternation so classification is a single scan of the error
+# string rather than one substring search per keyword.
+_NON_RETRIABLE_KEYWORDS = (
+    "user denied",
+    "user chose to abort",
+    "permission denied",
+    "eacces",
+    "authentication required",
+)
+_NON_RETRIABLE_RE = re.compile(
+    "|".join(map(re.escape, _NON_RETRIABLE_KEYWORDS)), re.IGNORECASE
+)
+
+# Aho-Corasick automaton over the same keywords, mirroring hooks.py: one
+# linear pass with no alternation bookkeeping. None when pyahocorasick is
+# not installed.
+_NON_RETRIABLE_AUTOMATON = None
+if ahocorasick is not None:
+    _NON_RETRIABLE_AUTOMATON = ahocorasick.Automaton()
+    for _kw in _NON_RETRIABLE_KEYWORDS:
+        _NON_RETRIABLE_AUTOMATON.add_word(_kw, _kw)
+    _NON_RETRIABLE_AUTOMATON.make_automaton()
+    del _kw
+
+
+async def _aio_input(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+
+    Uses loop.add_reader so the wait is a plain fd watch: Ctrl-C cancels it
+    immediately and no executor thread is parked in a blocking read().
+    Falls back to a thread when the platform's loop cannot watch pipes
+    (e.g. Windows proactor).
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[bytes] = loop.create_future()
+    fd = sys.stdin.fileno()
+
+    def _on_readable() -> None:
+        if not future.done():
+            future.set_result(os.read(fd, 4096))
+
+    try:
+        loop.add_reader(fd, _on_readable)
+    except NotImplementedError:
+        return await asyncio.to_thread(input)
+    try:
+        data = await future
+    finally:
+        loop.remove_reader(fd)
+    return data.decode(errors="replace").rstrip("\n")
+
 
 class Orchestrator:
     """Main orchestration loop: advance through features with retry and error handling."""
@@ -28,14 +90,33 @@ class Orchestrator:
         )
         self.runner = FeatureRunner(config)
         self._shutdown_requested = False
+        # Serializes state-file writes when features run concurrently.
+        self._state_lock = asyncio.Lock()
+        self._flusher_task: asyncio.Task | None = None
+        # Signal channel: handlers enqueue signums, _signal_consumer drains.
+        self._sig_queue: asyncio.Queue[signal.Signals] | None = None
+        self._sig_task: asyncio.Task | None = None
+        # Running passed-feature count, maintained incrementally so the
+        # per-feature header needs no O(N) rescan.
+        self._completed_count = 0
+        # Backoff delays by attempt number, computed once instead of a
+        # float pow per retry iteration.
+        self._backoff_schedule = tuple(
+            min(config.retry_backoff_base ** i, config.retry_backoff_max)
+            for i in range(config.max_retries + 1)
+        )
 
     async def run(self) -> None:
         """Main execution loop with graceful shutdown on Ctrl-C."""
 
-        # Install signal handlers for graceful shutdown
+        # Install signal handlers for graceful shutdown. Signals are only
+        # enqueued here; a single consumer task processes them serially, so
+        # a rapid SIGINT+SIGTERM pair cannot race the shutdown bookkeeping.
         loop = asyncio.get_running_loop()
+        self._sig_queue = asyncio.Queue()
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, self._handle_shutdown_signal, sig)
+            loop.add_signal_handler(sig, self._sig_queue.put_nowait, sig)
+        self._sig_task = asyncio.create_task(self._signal_consumer())
 
         self.logger.info("=" * 60)
         self.logger.info("Claude Code Orchestrator starting")
@@ -43,7 +124,10 @@ class Orchestrator:
         self.logger.info("=" * 60)
 
         # Load state
-        features = self.state.load_features()
+        # State I/O runs in worker threads so disk latency never stalls
+        # the event loop (stall detector, streaming reads).
+        features = await asyncio.to_thread(self.state.load_features)
+        self._completed_count = sum(1 for f in features if f.passes)
         self.logger.info(f"Loaded {len(features)} features")
         self.logger.info(self.state.get_progress_summary())
 
@@ -51,97 +135,124 @@ class Orchestrator:
             self._dry_run(features)
             return
 
+        # Coalesce per-feature state writes: save_features marks dirty and a
+        # background task flushes every few seconds (and at cleanup), so a
+        # retry-heavy run rewrites features.json O(runtime/interval) times
+        # instead of once per state change.
+        self.state.defer_saves()
+        self._flusher_task = asyncio.create_task(self._flush_state_loop())
+
+        if self.config.max_parallel_features > 1:
+            try:
+                await self._run_parallel(features)
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                self.logger.info("Interrupted by user")
+            finally:
+                await self._cleanup()
+            self.logger.info("=" * 60)
+            self.logger.info("Orchestration complete")
+            self.logger.info(self.state.get_progress_summary())
+            self.logger.info("=" * 60)
+            return
+
         consecutive_failures = 0
         max_consecutive_failures = 3
 
         try:
-            while not self._shutdown_requested:
-                # Find next feature
-                feature = self.state.get_next_feature(self.config.start_from_feature)
-                if feature is None:
-                    self.logger.info("All features complete!")
-                    break
-
-                if (
-                    self.config.stop_after_feature is not None
-                    and feature.id > self.config.stop_after_feature
-                ):
-                    self.logger.info(
-                        f"Reached stop-after limit (feature #{self.config.stop_after_feature})"
-                    )
-                    break
-
-                # Check retry budget
-                if feature.attempts >= self.config.max_retries:
-                    self.logger.error(
-                        f"Feature #{feature.id} has exhausted {self.config.max_retries} retries. "
-                        f"Last error: {feature.last_error}"
-                    )
-                    action = await self._ask_retry_exhausted(feature)
-                    if action == "skip":
-                        feature.status = FeatureStatus.SKIPPED
-                        self.state.save_features()
-                        continue
-                    elif action == "retry":
-                        feature.attempts = 0
-                        self.state.save_features()
-                        # Fall through to execution
-                    else:  # abort
-                        self.logger.info("User chose to abort orchestration")
+            # Reuse one SDK client (and its subprocess) across features.
+            # Parallel mode above keeps per-feature clients instead — a
+            # single client cannot serve concurrent sessions.
+            async with self.runner:
+                while not self._shutdown_requested:
+                    # Find next feature
+                    feature = self.state.get_next_feature(self.config.start_from_feature)
+                    if feature is None:
+                        self.logger.info("All features complete!")
                         break
 
-                # Display progress
-                self._print_feature_header(feature, features)
-
-                # Execute with retry
-                result = await self._execute_with_retry(feature)
-
-                # Record result
-                self.state.mark_feature(feature.id, result)
-
-                # Log progress
-                self.state.append_progress(ProgressEntry(
-                    timestamp=datetime.now(),
-                    feature_id=feature.id,
-                    feature_name=feature.name,
-                    status=FeatureStatus.PASSED if result.success else FeatureStatus.FAILED,
-                    summary=(
-                        f"Completed successfully in {result.duration_seconds:.0f}s"
-                        if result.success
-                        else f"Failed after {result.retries_used} retries: {result.error}"
-                    ),
-                    commit_hash=result.commit_hash,
-                    session_id=result.session_id,
-                    error=result.error,
-                ))
+                    if (
+                        self.config.stop_after_feature is not None
+                        and feature.id > self.config.stop_after_feature
+                    ):
+                        self.logger.info(
+                            f"Reached stop-after limit (feature #{self.config.stop_after_feature})"
+                        )
+                        break
 
-                if result.success:
-                    consecutive_failures = 0
-                    cost_str = f"${result.cost_usd:.2f}" if result.cost_usd else "n/a"
-                    self.logger.info(
-                        f"Feature #{feature.id} PASSED "
-                        f"({result.duration_seconds:.0f}s, cost: {cost_str})"
-                    )
-                    # Brief pause between features for Ctrl+C opportunity
-                    await asyncio.sleep(2)
-                else:
-                    consecutive_failures += 1
-                    self.logger.error(f"Feature #{feature.id} FAILED: {result.error}")
-                    if consecutive_failures >= max_consecutive_failures:
+                    # Check retry budget
+                    if feature.attempts >= self.config.max_retries:
                         self.logger.error(
-                            f"{max_consecutive_failures} consecutive failures. "
-                            f"Pausing for human review."
+                            f"Feature #{feature.id} has exhausted {self.config.max_retries} retries. "
+                            f"Last error: {feature.last_error}"
                         )
-                        action = await self._ask_consecutive_failures(feature)
-                        if action == "continue":
-                            consecutive_failures = 0
-                        else:
+                        action = await self._ask_retry_exhausted(feature)
+                        if action == "skip":
+                            feature.status = FeatureStatus.SKIPPED
+                            self.state.save_features()
+                            continue
+                        elif action == "retry":
+                            feature.attempts = 0
+                            self.state.save_features()
+                            # Fall through to execution
+                        else:  # abort
+                            self.logger.info("User chose to abort orchestration")
                             break
 
+                    # Display progress
+                    self._print_feature_header(feature, features)
+
+                    # Execute with retry
+                    result = await self._execute_with_retry(feature)
+
+                    # Record result
+                    self.state.mark_feature(feature.id, result)
+
+                    # Log progress
+                    await asyncio.to_thread(
+                        self.state.append_progress,
+                        feature_id=feature.id,
+                        feature_name=feature.name,
+                        status=FeatureStatus.PASSED if result.success else FeatureStatus.FAILED,
+                        summary=(
+                            f"Completed successfully in {result.duration_seconds:.0f}s"
+                            if result.success
+                            else f"Failed after {result.retries_used} retries: {result.error}"
+                        ),
+                        commit_hash=result.commit_hash,
+                        session_id=result.session_id,
+                        error=result.error,
+                    )
+
+                    if result.success:
+                        consecutive_failures = 0
+                        self._completed_count += 1
+                        cost_str = f"${result.cost_usd:.2f}" if result.cost_usd else "n/a"
+                        self.logger.info(
+                            f"Feature #{feature.id} PASSED "
+                            f"({result.duration_seconds:.0f}s, cost: {cost_str})"
+                        )
+                        # Single loop tick so a pending SIGINT handler runs
+                        # before the next feature; the handler sets
+                        # _shutdown_requested, so no polling delay is needed.
+                        await asyncio.sleep(0)
+                    else:
+                        consecutive_failures += 1
+                        self.logger.error(f"Feature #{feature.id} FAILED: {result.error}")
+                        if consecutive_failures >= max_consecutive_failures:
+                            self.logger.error(
+                                f"{max_consecutive_failures} consecutive failures. "
+                                f"Pausing for human review."
+                            )
+                            action = await self._ask_consecutive_failures(feature)
+                            if action == "continue":
+                                consecutive_failures = 0
+                            else:
+                                break
+
         except (KeyboardInterrupt, asyncio.CancelledError):
             self.logger.info("Interrupted by user")
         finally:
-            self._cleanup()
+            await self._cleanup()
 
         # Final summary
         self.logger.info("=" * 60)
@@ -149,50 +260,197 @@ class Orchestrator:
         self.logger.info(self.state.get_progress_summary())
         self.logger.info("=" * 60)
 
-    def _handle_shutdown_signal(self, sig: signal.Signals) -> None:
-        """Handle SIGINT/SIGTERM: kill child processes and request shutdown."""
-        sig_name = sig.name
-        if self._shutdown_requested:
-            # Second signal — force exit immediately
-            self.logger.warning(f"Second {sig_name} received — force exiting")
-            FeatureRunner.kill_active_subprocess()
-            raise SystemExit(1)
+    async def _run_parallel(self, features: list[Feature]) -> None:
+        """Dependency-aware scheduler running up to max_parallel_features at once.
+
+        A feature is ready when it is incomplete, within the retry budget,
+        inside the start/stop window, and all of its depends_on features have
+        passed. Human-in-the-loop pauses (retry-exhausted, consecutive
+        failures) are sequential-mode only: here exhausted features are
+        reported and left for a later sequential run.
+        """
+        semaphore = asyncio.Semaphore(self.config.max_parallel_features)
+        start_from = self.config.start_from_feature
+        stop_after = self.config.stop_after_feature
+        passed_ids = {f.id for f in features if f.passes}
+        running: dict[int, asyncio.Task] = {}
+        unrunnable: set[int] = set()
+
+        def _ready(f: Feature) -> bool:
+            if f.passes or f.id in running or f.id in unrunnable:
+                return False
+            if f.status == FeatureStatus.SKIPPED:
+                return False
+            if start_from is not None and f.id < start_from:
+                return False
+            if stop_after is not None and f.id > stop_after:
+                return False
+            return all(dep in passed_ids for dep in f.depends_on)
+
+        while not self._shutdown_requested:
+            for f in features:
+                if _ready(f):
+                    if f.attempts >= self.config.max_retries:
+                        self.logger.error(
+                            f"Feature #{f.id} has exhausted "
+                            f"{self.config.max_retries} retries — leaving for "
+                            f"a sequential run. Last error: {f.last_error}"
+                        )
+                        unrunnable.add(f.id)
+                        continue
+                    running[f.id] = asyncio.create_task(
+                        self._run_one(f, semaphore)
+                    )
 
+            if not running:
+                remaining = [
+                    f.id for f in features
+                    if not f.passes and f.id not in unrunnable
+                    and f.status != FeatureStatus.SKIPPED
+                    and (start_from is None or f.id >= start_from)
+                    and (stop_after is None or f.id <= stop_after)
+                ]
+                if remaining:
+                    self.logger.error(
+                        f"No runnable features; unmet dependencies or "
+                        f"exhausted retries block: {remaining}"
+                    )
+                else:
+                    self.logger.info("All features complete!")
+                return
+
+            done, _ = await asyncio.wait(
+                running.values(), return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                feature, result = task.result()
+                del running[feature.id]
+                if result.success:
+                    passed_ids.add(feature.id)
+                else:
+                    unrunnable.add(feature.id)
+
+        if running:
+            for task in running.values():
+                task.cancel()
+            await asyncio.gather(*running.values(), return_exceptions=True)
+
+    async def _run_one(
+        self, feature: Feature, semaphore: asyncio.Semaphore,
+    ) -> tuple[Feature, FeatureResult]:
+        """Run one feature under the concurrency gate and record its result."""
+        async with semaphore:
+            self.logger.info(f"Feature #{feature.id}: {feature.name} — starting")
+            result = await self._execute_with_retry(feature)
+
+        async with self._state_lock:
+            self.state.mark_feature(feature.id, result)
+            await asyncio.to_thread(
+                self.state.append_progress,
+                feature_id=feature.id,
+                feature_name=feature.name,
+                status=FeatureStatus.PASSED if result.success else FeatureStatus.FAILED,
+                summary=(
+                    f"Completed successfully in {result.duration_seconds:.0f}s"
+                    if result.success
+                    else f"Failed after {result.retries_used} retries: {result.error}"
+                ),
+                commit_hash=result.commit_hash,
+                session_id=result.session_id,
+                error=result.error,
+            )
+
+        if result.success:
+            self._completed_count += 1
+            cost_str = f"${result.cost_usd:.2f}" if result.cost_usd else "n/a"
+            self.logger.info(
+                f"Feature #{feature.id} PASSED "
+                f"({result.duration_seconds:.0f}s, cost: {cost_str})"
+            )
+        else:
+            self.logger.error(f"Feature #{feature.id} FAILED: {result.error}")
+        return feature, result
+
+    async def _signal_consumer(self) -> None:
+        """Process SIGINT/SIGTERM serially: first graceful, second forced."""
+        first = await self._sig_queue.get()
         self._shutdown_requested = True
-        self.logger.info(f"\n{sig_name} received — shutting down gracefully...")
+        self.logger.info(f"\n{first.name} received — shutting down gracefully...")
         self.logger.info("  (press Ctrl-C again to force-quit)")
-        FeatureRunner.kill_active_subprocess()
+        kill_task = asyncio.create_task(
+            FeatureRunner.kill_active_subprocesses_async()
+        )
 
-    def _cleanup(self) -> None:
-        """Final cleanup: kill any lingering subprocesses."""
+        second = await self._sig_queue.get()
+        self.logger.warning(f"Second {second.name} received — force exiting")
+        kill_task.cancel()
+        FeatureRunner.kill_active_subprocess()
+        # SystemExit from a task propagates out of the event loop.
+        raise SystemExit(1)
+
+    async def _flush_state_loop(self) -> None:
+        """Background task writing dirty feature state every few seconds."""
+        while True:
+            await asyncio.sleep(5)
+            # The state lock keeps the snapshot consistent when parallel
+            # workers are mid-mark_feature.
+            async with self._state_lock:
+                await asyncio.to_thread(self.state.flush)
+
+    async def _cleanup(self) -> None:
+        """Final cleanup: flush pending state and kill lingering subprocesses."""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            # A flush already running on an executor thread outlives the
+            # cancel; wait the task out so the final flush below cannot
+            # overlap it (StateManager's write lock covers the rest).
+            await asyncio.gather(self._flusher_task, return_exceptions=True)
+            self._flusher_task = None
+        if self._sig_task is not None:
+            self._sig_task.cancel()
+            self._sig_task = None
+        self.state.flush()
+        self.state.close()
         FeatureRunner.kill_active_subprocess()
 
+    async def _execute_once(self, feature: Feature, attempt: int) -> FeatureResult:
+        """Run a single attempt and stamp the retry count on the result."""
+        result = await self.runner.run_feature(feature)
+        result.retries_used = attempt
+        return result
+
     async def _execute_with_retry(self, feature: Feature) -> FeatureResult:
         """Execute a feature with exponential backoff retry."""
-        last_result: FeatureResult | None = None
         retries_remaining = max(0, self.config.max_retries - feature.attempts)
 
+        # Fast path: no retry budget left means exactly one attempt, so skip
+        # the loop machinery entirely.
+        if retries_remaining == 0:
+            result = await self._execute_once(feature, 0)
+            if not result.success:
+                self.logger.warning(f"Attempt 1 failed: {result.error}")
+            return result
+
+        last_result: FeatureResult | None = None
         for attempt in range(retries_remaining + 1):
             if attempt > 0:
-                backoff = min(
-                    self.config.retry_backoff_base ** attempt,
-                    self.config.retry_backoff_max,
-                )
-                self.logger.info(
-                    f"Retry {attempt}/{retries_remaining} for feature #{feature.id} "
-                    f"(backoff: {backoff:.1f}s)"
-                )
+                backoff = self._backoff_schedule[attempt]
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(
+                        f"Retry {attempt}/{retries_remaining} for feature "
+                        f"#{feature.id} (backoff: {backoff:.1f}s)"
+                    )
                 await asyncio.sleep(backoff)
 
-            result = await self.runner.run_feature(feature)
-            result.retries_used = attempt
-
+            result = await self._execute_once(feature, attempt)
             if result.success:
                 return result
 
             last_result = result
             self.logger.warning(f"Attempt {attempt + 1} failed: {result.error}")
 
+            # Checked before the next iteration's backoff sleep, so a
+            # non-retriable failure never waits out a backoff first.
             if not self._is_retriable_error(result.error):
                 self.logger.error("Non-retriable error. Stopping retries.")
                 break
@@ -208,23 +466,20 @@ class Orchestrator:
         """Determine if an error warrants a retry."""
         if not error:
             return True
-        non_retriable_keywords = [
-            "user denied",
-            "user chose to abort",
-            "permission denied",
-            "eacces",
-            "authentication required",
-        ]
-        error_lower = error.lower()
-        return not any(kw in error_lower for kw in non_retriable_keywords)
+        if _NON_RETRIABLE_AUTOMATON is not None:
+            # The automaton matches case-sensitively, so this path still
+            # pays for one lowered copy.
+            for _ in _NON_RETRIABLE_AUTOMATON.iter(error.lower()):
+                return False
+            return True
+        return _NON_RETRIABLE_RE.search(error) is None
 
     async def _ask_retry_exhausted(self, feature: Feature) -> str:
         """Ask user what to do when retries are exhausted."""
         print(f"\nFeature #{feature.id} ({feature.name}) failed {feature.attempts} times.")
         print(f"Last error: {feature.last_error}")
         print("Options: [s]kip  [r]etry (reset counter)  [a]bort")
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(None, lambda: input("Choice: "))
+        response = await _aio_input("Choice: ")
         r = response.strip().lower()
         if r.startswith("s"):
             return "skip"
@@ -236,8 +491,7 @@ class Orchestrator:
         """Ask user whether to continue after consecutive failures."""
         print(f"\nMultiple consecutive failures. Last on feature #{feature.id}.")
         print("Options: [c]ontinue  [a]bort")
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(None, lambda: input("Choice: "))
+        response = await _aio_input("Choice: ")
         if response.strip().lower().startswith("c"):
             return "continue"
         return "abort"
@@ -246,12 +500,11 @@ class Orchestrator:
         self, feature: Feature, all_features: list[Feature],
     ) -> None:
         total = len(all_features)
-        completed = sum(1 for f in all_features if f.passes)
         attempt_str = f" (attempt {feature.attempts + 1})" if feature.attempts > 0 else ""
         print()
         print("=" * 60)
         print(f"Feature #{feature.id} / {total}: {feature.name}{attempt_str}")
-        print(f"Progress: {completed} / {total} complete")
+        print(f"Progress: {self._completed_count} / {total} complete")
         print("=" * 60)
 
     def _dry_run(self, features: list[Feature]) -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from string import Template
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -13,18 +14,18 @@ You are implementing a single feature for this project. Follow these instruction
 
 ## Your Task
 
-Implement Feature #{feature_id}: {feature_name}
+Implement Feature #${feature_id}: ${feature_name}
 
 ### Implementation Steps
-{steps_text}
+${steps_text}
 
 ## Protocol
 
-1. **Orientation**: Run `pwd` to confirm working directory. Check `git log --oneline -5` for recent context.{init_script_instruction}
-2. **Read project state**: Read the progress file at `{progress_file}` for context on recent work.
+1. **Orientation**: Run `pwd` to confirm working directory. Check `git log --oneline -5` for recent context.${init_script_instruction}
+2. **Read project state**: Read the progress file at `${progress_file}` for context on recent work.
 3. **Implement**: Work through the implementation steps above. Use the project's existing patterns and conventions.
-4. **Verify**: Verify the feature works as expected. Run the project's build command to confirm no errors.{mcp_verification_instruction}
-5. **Commit**: Create a git commit with message: `{commit_prefix}implement feature #{feature_id} -- {feature_name}`
+4. **Verify**: Verify the feature works as expected. Run the project's build command to confirm no errors.${mcp_verification_instruction}
+5. **Commit**: Create a git commit with message: `${commit_prefix}implement feature #${feature_id} -- ${feature_name}`
 6. **STOP**: Print a short completion summary. Do NOT continue to the next feature. One feature per session.
 
 ## If You Get Stuck
@@ -41,12 +42,20 @@ Implement Feature #{feature_id}: {feature_name}
 - Stop after committing. Do not proceed to the next feature.
 """
 
+# Parsed once at import: Template.substitute walks the pre-split parts,
+# whereas str.format re-parses the whole template string on every call.
+_FEATURE_PROMPT = Template(FEATURE_PROMPT_TEMPLATE)
+
+# Config-dependent fragments are identical for every feature in a run;
+# cache them keyed by the settings they derive from.
+_config_fragments: dict[tuple, tuple[str, str]] = {}
 
-def build_feature_prompt(feature: Feature, config: OrchestratorConfig) -> str:
-    """Build the full prompt for a feature worker session."""
-    steps_text = "\n".join(
-        f"  {i + 1}. {step}" for i, step in enumerate(feature.steps)
-    )
+
+def _fragments_for(config: OrchestratorConfig) -> tuple[str, str]:
+    key = (config.init_script, "playwright" in config.mcp_servers)
+    cached = _config_fragments.get(key)
+    if cached is not None:
+        return cached
 
     init_instruction = ""
     if config.init_script:
@@ -62,7 +71,19 @@ def build_feature_prompt(feature: Feature, config: OrchestratorConfig) -> str:
             "visually verify rendering in both dark and light themes."
         )
 
-    return FEATURE_PROMPT_TEMPLATE.format(
+    fragments = (init_instruction, mcp_instruction)
+    _config_fragments[key] = fragments
+    return fragments
+
+
+def build_feature_prompt(feature: Feature, config: OrchestratorConfig) -> str:
+    """Build the full prompt for a feature worker session."""
+    steps_text = "\n".join(
+        f"  {i + 1}. {step}" for i, step in enumerate(feature.steps)
+    )
+    init_instruction, mcp_instruction = _fragments_for(config)
+
+    return _FEATURE_PROMPT.substitute(
         feature_id=feature.id,
         feature_name=feature.name,
         steps_text=steps_text,
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import operator
 import os
+import re
 import signal
-import subprocess
 import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from claude_agent_sdk import (
@@ -22,6 +24,11 @@ from claude_agent_sdk import (
     ToolResultBlock,
 )
 
+try:
+    import pygit2  # in-process libgit2: HEAD lookup without fork+exec
+except ImportError:
+    pygit2 = None
+
 from .hooks import OrchestratorHooks
 from .human_input import HumanInputHandler
 from .models import Feature, FeatureResult
@@ -32,146 +39,238 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("orchestrator")
 
+# First non-whitespace character through end of its line.
+_FIRST_LINE_RE = re.compile(r"[^\s][^\n]*")
+
+# Tool-use log lines coalesced per record (see _drive_session).
+_TOOL_LOG_BATCH = 16
+
+
+def _fmt_bash(inp: dict) -> str:
+    cmd = inp.get("command", "")
+    if len(cmd) > 80:
+        cmd = cmd[:77] + "..."
+    return f" $ {cmd}"
+
+
+def _fmt_file_path(inp: dict) -> str:
+    return f" {inp.get('file_path', '')}"
+
+
+# O(1) dispatch instead of a chain of name comparisons per tool block.
+# Playwright MCP tools keep a prefix check in _format_tool_use.
+_TOOL_FORMATTERS: dict[str, Callable[[dict], str]] = {
+    "Read": _fmt_file_path,
+    "Edit": _fmt_file_path,
+    "Write": _fmt_file_path,
+    "Bash": _fmt_bash,
+    "Glob": lambda inp: f" {inp.get('pattern', '')}",
+    "Grep": lambda inp: f" /{inp.get('pattern', '')}/",
+    "Task": lambda inp: f" [{inp.get('subagent_type', '')}]",
+}
 
-def _get_sdk_subprocess_pid(client: ClaudeSDKClient) -> int | None:
-    """Extract the PID of the Claude Code subprocess from the SDK client.
 
-    Navigates: client._transport._process.pid
+# Single compiled accessor for the SDK-internal attribute chain.
+_PROC_GETTER = operator.attrgetter("_transport._process")
+
+
+def _get_sdk_subprocess(client: ClaudeSDKClient):
+    """Extract the Claude Code subprocess object from the SDK client.
+
+    Navigates: client._transport._process
     Returns None if any attribute is missing (SDK internals changed).
+    Tracking the process object (not just the PID) avoids PID-reuse
+    hazards and lets shutdown await the actual exit.
     """
     try:
-        transport = getattr(client, "_transport", None)
-        if transport is None:
-            return None
-        proc = getattr(transport, "_process", None)
-        if proc is None:
-            return None
-        return getattr(proc, "pid", None)
-    except Exception:
+        return _PROC_GETTER(client)
+    except AttributeError:
+        logger.debug("SDK transport layout changed; cannot resolve worker process")
         return None
 
 
 class FeatureRunner:
     """Executes a single feature using the Claude Agent SDK."""
 
-    # Class-level tracking of the active client for signal-based cleanup
-    _active_client: ClaudeSDKClient | None = None
-    _active_client_pid: int | None = None
+    # Class-level tracking of active clients for signal-based cleanup,
+    # keyed by feature id (multiple features may run concurrently).
+    # _active_procs holds the transport subprocess objects so shutdown can
+    # await their exit; _active_pids mirrors the PIDs for the sync path.
+    _active_clients: dict[int, ClaudeSDKClient] = {}
+    _active_procs: dict[int, object] = {}
+    _active_pids: dict[int, int] = {}
 
     def __init__(self, config: OrchestratorConfig):
         self.config = config
+        # Persistent-session state, populated inside `async with runner:`.
+        self._persistent = False
+        self._client: ClaudeSDKClient | None = None
+        self._hooks: OrchestratorHooks | None = None
+        self._human_handler: HumanInputHandler | None = None
+        # Cumulative usage of the current shared session. The CLI enforces
+        # max_turns / max_budget_usd against the whole session, and
+        # ResultMessage totals are session-cumulative, so per-feature
+        # accounting needs these to convert totals into deltas and to
+        # decide when a respawn is needed to restore full cap headroom.
+        self._session_cost_usd = 0.0
+        self._session_turns = 0
+        # Opened once when pygit2 is installed; None otherwise (or when
+        # project_dir is not a git repo) — commit lookup then falls back
+        # to reading .git files / spawning git.
+        self._repo = None
+        if pygit2 is not None:
+            try:
+                self._repo = pygit2.Repository(str(config.project_dir))
+            except Exception:
+                pass
+        # Config-derived option fields never change after init; only the
+        # hooks and permission callback are per-session. Built once here
+        # instead of once per feature.
+        self._options_template: dict = dict(
+            model=config.model,
+            permission_mode=config.permission_mode,
+            allowed_tools=config.allowed_tools,
+            disallowed_tools=config.disallowed_tools,
+            cwd=str(config.project_dir),
+            max_turns=config.max_turns_per_feature,
+            max_budget_usd=config.max_budget_per_feature_usd,
+            setting_sources=["project"],
+            mcp_servers=config.mcp_servers,
+        )
 
-    async def run_feature(self, feature: Feature) -> FeatureResult:
-        """Execute a feature with stall detection and progress streaming."""
-        start_time = time.monotonic()
+    async def __aenter__(self) -> FeatureRunner:
+        """Enable client reuse across features.
 
-        # Initialize hooks and human input handler
-        hooks = OrchestratorHooks(stall_timeout=self.config.stall_timeout_seconds)
-        human_handler = HumanInputHandler(
-            input_timeout=self.config.human_input_timeout_seconds,
-            prompt_unknown_tools=self.config.prompt_unknown_tools,
-        )
+        The Claude Code subprocess spawn (fork+exec+init, hundreds of ms)
+        is paid once per run instead of once per feature. The client is
+        created lazily on the first run_feature call, so dry runs and
+        callers that never execute a feature spawn nothing.
+        """
+        self._persistent = True
+        return self
 
-        # Build the prompt
-        prompt = build_feature_prompt(feature=feature, config=self.config)
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        self._persistent = False
+        self._hooks = None
+        self._human_handler = None
+        await self._discard_client()
+        return False
 
-        # Build SDK options
-        options = ClaudeAgentOptions(
-            model=self.config.model,
-            permission_mode=self.config.permission_mode,
-            allowed_tools=self.config.allowed_tools,
-            disallowed_tools=self.config.disallowed_tools,
-            cwd=str(self.config.project_dir),
-            max_turns=self.config.max_turns_per_feature,
-            max_budget_usd=self.config.max_budget_per_feature_usd,
-            can_use_tool=human_handler.can_use_tool,
-            setting_sources=["project"],
-            mcp_servers=self.config.mcp_servers,
-            hooks={
-                "PreToolUse": [
-                    # Keepalive must come first (Python SDK requirement)
-                    HookMatcher(matcher=None, hooks=[hooks.keepalive_hook]),
-                    # Security on Bash commands
-                    HookMatcher(matcher="Bash", hooks=[hooks.security_hook]),
-                    # Activity tracking on all tools
-                    HookMatcher(matcher=None, hooks=[hooks.activity_tracker]),
-                ],
-                "PostToolUse": [
-                    HookMatcher(matcher=None, hooks=[hooks.post_tool_logger]),
-                ],
-                "Stop": [
-                    HookMatcher(hooks=[hooks.stop_hook]),
-                ],
-            },
-        )
+    async def _discard_client(self) -> None:
+        """Drop the shared client (best-effort disconnect) and reset usage.
 
-        # Execute
-        session_id: str | None = None
-        cost_usd: float | None = None
-        is_error = False
-        error_msg: str | None = None
-        tool_count = 0
+        The next run_feature call spawns a fresh session with full turn
+        and budget headroom.
+        """
+        client, self._client = self._client, None
+        self._session_cost_usd = 0.0
+        self._session_turns = 0
+        if client is not None:
+            try:
+                await client.disconnect()
+            except Exception:
+                pass
 
-        try:
-            async with ClaudeSDKClient(options) as client:
-                FeatureRunner._active_client = client
+    def _caps_consumed(self) -> bool:
+        """True when the shared session has eaten into a per-feature cap.
 
-                await client.query(prompt)
+        max_turns / max_budget_usd are passed to the CLI at spawn and
+        enforced against the cumulative session, so any prior consumption
+        leaves the next feature less than its configured allowance. A
+        fresh session is the only way to restore full headroom.
+        """
+        if self.config.max_turns_per_feature and self._session_turns > 0:
+            return True
+        return (
+            self.config.max_budget_per_feature_usd is not None
+            and self._session_cost_usd > 0
+        )
 
-                # Capture subprocess PID for cleanup on Ctrl-C.
-                # Must be after query() — that's when the subprocess spawns.
-                FeatureRunner._active_client_pid = _get_sdk_subprocess_pid(client)
+    async def run_feature(self, feature: Feature) -> FeatureResult:
+        """Execute a feature with stall detection and progress streaming."""
+        start_time = time.monotonic()
 
-                # Launch stall detector in background
-                stall_task = asyncio.create_task(
-                    self._stall_detector(hooks, client, feature.id)
+        # Initialize hooks and human input handler (reused across features
+        # in persistent mode; hooks counters reset per feature)
+        if self._persistent:
+            if self._hooks is None:
+                self._hooks = OrchestratorHooks(
+                    stall_timeout=self.config.stall_timeout_seconds
                 )
+                self._human_handler = HumanInputHandler(
+                    input_timeout=self.config.human_input_timeout_seconds,
+                    auto_deny_tools=self.config.disallowed_tools_set,
+                    prompt_unknown_tools=self.config.prompt_unknown_tools,
+                )
+            hooks = self._hooks
+            hooks.reset()
+            human_handler = self._human_handler
+        else:
+            hooks = OrchestratorHooks(stall_timeout=self.config.stall_timeout_seconds)
+            human_handler = HumanInputHandler(
+                input_timeout=self.config.human_input_timeout_seconds,
+                auto_deny_tools=self.config.disallowed_tools_set,
+                prompt_unknown_tools=self.config.prompt_unknown_tools,
+            )
 
-                try:
-                    async for message in client.receive_messages():
-                        # Capture session_id from init message
-                        if isinstance(message, SystemMessage):
-                            if message.subtype == "init":
-                                session_id = message.data.get("session_id")
-                                logger.info(f"  Session started (id: {session_id})")
-
-                        # Stream progress from assistant messages
-                        if isinstance(message, AssistantMessage):
-                            for block in message.content:
-                                if isinstance(block, TextBlock):
-                                    self._log_assistant_text(block.text)
-                                elif isinstance(block, ToolUseBlock):
-                                    tool_count += 1
-                                    self._log_tool_use(block, tool_count)
-
-                        # Capture final result
-                        if isinstance(message, ResultMessage):
-                            is_error = message.is_error
-                            cost_usd = message.total_cost_usd
-                            session_id = session_id or message.session_id
-                            if is_error:
-                                error_msg = message.result
-                            break
-                finally:
-                    stall_task.cancel()
-                    try:
-                        await stall_task
-                    except asyncio.CancelledError:
-                        pass
-                    FeatureRunner._active_client = None
-                    FeatureRunner._active_client_pid = None
+        # Build the prompt
+        prompt = build_feature_prompt(feature=feature, config=self.config)
 
+        try:
+            if self._persistent:
+                # Respawn rather than reuse once the session has consumed
+                # part of a per-feature cap, so each feature runs against
+                # its full configured allowance.
+                if self._client is not None and self._caps_consumed():
+                    await self._discard_client()
+                if self._client is None:
+                    self._client = ClaudeSDKClient(
+                        self._build_options(hooks, human_handler)
+                    )
+                    await self._client.connect()
+                state = await self._drive_session(
+                    self._client, hooks, feature, prompt
+                )
+            else:
+                async with ClaudeSDKClient(
+                    self._build_options(hooks, human_handler)
+                ) as client:
+                    state = await self._drive_session(client, hooks, feature, prompt)
+            session_id, cost_usd, num_turns, is_error, error_msg, commit_task = state
+            if self._persistent and self._client is not None:
+                # ResultMessage totals cover the whole shared session;
+                # report this feature's cost as the delta and record the
+                # cumulative figures for the _caps_consumed check.
+                if cost_usd is not None:
+                    cost_usd -= self._session_cost_usd
+                    self._session_cost_usd += cost_usd
+                if num_turns:
+                    self._session_turns = num_turns
         except Exception as e:
-            FeatureRunner._active_client = None
-            FeatureRunner._active_client_pid = None
+            FeatureRunner._active_clients.pop(feature.id, None)
+            FeatureRunner._active_procs.pop(feature.id, None)
+            FeatureRunner._active_pids.pop(feature.id, None)
+            if self._persistent:
+                # A failed connect/query/stream leaves the shared client in
+                # an unknown state; discard it so the next feature
+                # reconnects instead of reusing it.
+                await self._discard_client()
+            session_id = None
+            cost_usd = None
+            commit_task = None
             is_error = True
             error_msg = f"{type(e).__name__}: {str(e)}"
             logger.error(f"Feature #{feature.id} crashed: {error_msg}")
 
         # Check git for commit hash
         commit_hash = None
-        if not is_error:
-            commit_hash = self._get_latest_commit_hash()
+        if commit_task is not None:
+            if is_error:
+                commit_task.cancel()
+            else:
+                commit_hash = await commit_task
+        elif not is_error:
+            commit_hash = await self._get_latest_commit_hash()
 
         duration = time.monotonic() - start_time
 
@@ -185,91 +284,255 @@ class FeatureRunner:
             cost_usd=cost_usd,
         )
 
+    def _build_options(
+        self,
+        hooks: OrchestratorHooks,
+        human_handler: HumanInputHandler,
+    ) -> ClaudeAgentOptions:
+        """Build SDK options bound to the given hooks and input handler."""
+        return ClaudeAgentOptions(
+            **self._options_template,
+            can_use_tool=human_handler.can_use_tool,
+            hooks={
+                "PreToolUse": [
+                    # One fused callback (keepalive + security + activity):
+                    # a single coroutine per tool call instead of three.
+                    HookMatcher(matcher=None, hooks=[hooks.pre_tool_use]),
+                ],
+                "PostToolUse": [
+                    HookMatcher(matcher=None, hooks=[hooks.post_tool_logger]),
+                ],
+                "Stop": [
+                    HookMatcher(hooks=[hooks.stop_hook]),
+                ],
+            },
+        )
+
+    async def _drive_session(
+        self,
+        client: ClaudeSDKClient,
+        hooks: OrchestratorHooks,
+        feature: Feature,
+        prompt: str,
+    ) -> tuple[str | None, float | None, int, bool, str | None, asyncio.Task | None]:
+        """Send the prompt and consume messages until the result.
+
+        Returns (session_id, cost_usd, num_turns, is_error, error_msg,
+        commit_task). cost_usd and num_turns are the session-cumulative
+        totals from the ResultMessage; run_feature converts them to
+        per-feature deltas when the client is shared.
+        """
+        session_id: str | None = None
+        cost_usd: float | None = None
+        num_turns = 0
+        is_error = False
+        error_msg: str | None = None
+        tool_count = 0
+        commit_task: asyncio.Task[str | None] | None = None
+        # Tool-use lines are batched into one log record per
+        # _TOOL_LOG_BATCH events so heavy tool traffic doesn't interleave
+        # hundreds of logger calls with SDK message processing.
+        tool_log_buf: list[str] = []
+
+        FeatureRunner._active_clients[feature.id] = client
+
+        await client.query(prompt)
+
+        # Capture the subprocess for cleanup on Ctrl-C.
+        # Must be after query() — that's when the subprocess spawns.
+        proc = _get_sdk_subprocess(client)
+        pid = getattr(proc, "pid", None)
+        if pid is not None:
+            FeatureRunner._active_procs[feature.id] = proc
+            FeatureRunner._active_pids[feature.id] = pid
+
+        # Launch stall detector in background
+        stall_task = asyncio.create_task(
+            self._stall_detector(hooks, client, feature.id)
+        )
+
+        def _on_system(message: SystemMessage) -> bool:
+            # Capture session_id from init message
+            nonlocal session_id
+            if message.subtype == "init":
+                session_id = message.data.get("session_id")
+                logger.info(f"  Session started (id: {session_id})")
+                # Nothing else is read from system messages; dropping the
+                # handler makes the rest of them a failed dict lookup.
+                del handlers[SystemMessage]
+            return False
+
+        def _on_assistant(message: AssistantMessage) -> bool:
+            # Stream progress from assistant messages
+            nonlocal tool_count
+            for block in message.content:
+                if isinstance(block, TextBlock):
+                    self._log_assistant_text(block.text)
+                elif isinstance(block, ToolUseBlock):
+                    tool_count += 1
+                    tool_log_buf.append(
+                        self._format_tool_use(block, tool_count)
+                    )
+                    if len(tool_log_buf) >= _TOOL_LOG_BATCH:
+                        logger.info("\n".join(tool_log_buf))
+                        tool_log_buf.clear()
+            return False
+
+        def _on_result(message: ResultMessage) -> bool:
+            # Capture final result
+            nonlocal is_error, cost_usd, num_turns, session_id, error_msg
+            nonlocal commit_task
+            is_error = message.is_error
+            cost_usd = message.total_cost_usd
+            num_turns = message.num_turns
+            session_id = session_id or message.session_id
+            if is_error:
+                error_msg = message.result
+            else:
+                # Prefetch the commit hash so git latency overlaps with
+                # stall-task teardown.
+                commit_task = asyncio.create_task(
+                    self._get_latest_commit_hash()
+                )
+            return True
+
+        # Exact-type dispatch: one dict lookup per message instead of an
+        # isinstance chain walking each type's MRO.
+        handlers = {
+            SystemMessage: _on_system,
+            AssistantMessage: _on_assistant,
+            ResultMessage: _on_result,
+        }
+
+        try:
+            async for message in client.receive_messages():
+                handler = handlers.get(type(message))
+                if handler is not None and handler(message):
+                    break
+        finally:
+            if tool_log_buf:
+                logger.info("\n".join(tool_log_buf))
+            # gather(return_exceptions=True) absorbs the stall task's
+            # CancelledError without swallowing a cancellation aimed at
+            # run_feature itself, so outer timeouts/task groups still see
+            # their own cancel.
+            stall_task.cancel()
+            await asyncio.gather(stall_task, return_exceptions=True)
+            FeatureRunner._active_clients.pop(feature.id, None)
+            FeatureRunner._active_procs.pop(feature.id, None)
+            FeatureRunner._active_pids.pop(feature.id, None)
+
+        return session_id, cost_usd, num_turns, is_error, error_msg, commit_task
+
     # --- Progress streaming helpers ---
 
     @staticmethod
     def _log_assistant_text(text: str) -> None:
         """Log assistant text, showing the first meaningful line as progress."""
-        # Show the first non-empty line, trimmed to 120 chars
-        for line in text.split("\n"):
-            line = line.strip()
-            if line:
-                if len(line) > 120:
-                    line = line[:117] + "..."
-                logger.info(f"  Claude: {line}")
-                # Only log additional lines at debug to avoid flooding
-                break
-        logger.debug(f"  [full text] {text[:500]}")
+        # Show the first non-empty line, trimmed to 120 chars. The regex
+        # scan slices just that line out instead of splitting the whole
+        # message into a list of lines.
+        m = _FIRST_LINE_RE.search(text)
+        if m:
+            line = m.group().rstrip()
+            if len(line) > 120:
+                line = line[:117] + "..."
+            logger.info(f"  Claude: {line}")
+            # Only log additional lines at debug to avoid flooding
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  [full text] %s", text[:500])
 
     @staticmethod
-    def _log_tool_use(block: ToolUseBlock, count: int) -> None:
-        """Log tool use with a concise summary."""
+    def _format_tool_use(block: ToolUseBlock, count: int) -> str:
+        """Format a tool use as a concise one-line summary."""
         name = block.name
-        inp = block.input
-        detail = ""
-        if name == "Read":
-            detail = f" {inp.get('file_path', '')}"
-        elif name == "Edit":
-            path = inp.get("file_path", "")
-            detail = f" {path}"
-        elif name == "Write":
-            detail = f" {inp.get('file_path', '')}"
-        elif name == "Bash":
-            cmd = inp.get("command", "")
-            if len(cmd) > 80:
-                cmd = cmd[:77] + "..."
-            detail = f" $ {cmd}"
-        elif name == "Glob":
-            detail = f" {inp.get('pattern', '')}"
-        elif name == "Grep":
-            detail = f" /{inp.get('pattern', '')}/"
+        formatter = _TOOL_FORMATTERS.get(name)
+        if formatter is not None:
+            detail = formatter(block.input)
         elif name.startswith("mcp__playwright"):
             short = name.replace("mcp__playwright__", "pw:")
             detail = f" ({short})"
             name = "Playwright"
-        elif name == "Task":
-            detail = f" [{inp.get('subagent_type', '')}]"
-
-        logger.info(f"  [{count:3d}] {name}{detail}")
+        else:
+            detail = ""
 
-    @classmethod
-    def kill_active_subprocess(cls) -> None:
-        """Kill the active Claude Code subprocess, if any.
-
-        Called during signal handling to prevent orphaned processes.
-        Uses SIGTERM first, then SIGKILL after a brief wait.
-        Also kills the entire process group to catch child processes
-        (e.g., dev servers spawned by the worker).
-        """
-        pid = cls._active_client_pid
-        cls._active_client = None
-        cls._active_client_pid = None
+        return f"  [{count:3d}] {name}{detail}"
 
-        if pid is None:
-            return
-
-        logger.info(f"  Terminating Claude Code subprocess (PID {pid})...")
+    @staticmethod
+    def _signal_group(pid: int, sig: signal.Signals) -> None:
+        """Send a signal to pid's process group, falling back to direct kill."""
         try:
             # Kill the process group (catches child processes like dev servers)
-            pgid = os.getpgid(pid)
-            os.killpg(pgid, signal.SIGTERM)
+            os.killpg(os.getpgid(pid), sig)
         except (ProcessLookupError, PermissionError, OSError):
             # Process already gone, or not a group leader — try direct kill
             try:
-                os.kill(pid, signal.SIGTERM)
+                os.kill(pid, sig)
             except (ProcessLookupError, PermissionError):
                 pass
 
+    @classmethod
+    async def kill_active_subprocesses_async(cls) -> None:
+        """Terminate all active Claude Code subprocesses with bounded latency.
+
+        SIGTERM to each process group, await exit for up to 2s, then
+        escalate to SIGKILL. Awaiting the tracked process object (rather
+        than polling a raw PID) avoids PID-reuse hazards and guarantees
+        no zombies are left behind.
+        """
+        procs = list(cls._active_procs.items())
+        cls._active_clients.clear()
+        cls._active_procs.clear()
+        cls._active_pids.clear()
+
+        for feature_id, proc in procs:
+            pid = getattr(proc, "pid", None)
+            if pid is None:
+                continue
+            logger.info(f"  Terminating Claude Code subprocess (PID {pid})...")
+            cls._signal_group(pid, signal.SIGTERM)
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=2.0)
+            except Exception:
+                logger.warning(f"  PID {pid} did not exit in 2s — sending SIGKILL")
+                cls._signal_group(pid, signal.SIGKILL)
+                try:
+                    await proc.wait()
+                except Exception:
+                    pass
+
+    @classmethod
+    def kill_active_subprocess(cls) -> None:
+        """Kill all active Claude Code subprocesses, if any (sync fallback).
+
+        Used where no event loop is available (final cleanup, second
+        Ctrl-C force exit). Sends SIGTERM to each process group without
+        awaiting exit; the async variant above is preferred.
+        """
+        pids = list(cls._active_pids.values())
+        cls._active_clients.clear()
+        cls._active_procs.clear()
+        cls._active_pids.clear()
+
+        for pid in pids:
+            logger.info(f"  Terminating Claude Code subprocess (PID {pid})...")
+            cls._signal_group(pid, signal.SIGTERM)
+
     async def _stall_detector(
         self,
         hooks: OrchestratorHooks,
         client: ClaudeSDKClient,
         feature_id: int,
     ) -> None:
-        """Background task that interrupts the client if stalled."""
+        """Background task that interrupts the client if stalled.
+
+        Event-driven: sleeps until exactly the stall deadline and is woken
+        early by the activity-event pulse from the hooks, so detection
+        fires at the timeout boundary instead of on a 30s polling grid.
+        """
         while True:
-            await asyncio.sleep(30)
-            if hooks.is_stalled:
+            remaining = hooks.stall_timeout - hooks.seconds_since_last_activity
+            if remaining <= 0:
                 elapsed = hooks.seconds_since_last_activity
                 logger.warning(
                     f"Feature #{feature_id}: stall detected "
@@ -277,19 +540,59 @@ class FeatureRunner:
                 )
                 await client.interrupt()
                 return
+            try:
+                await asyncio.wait_for(hooks.activity_event.wait(), remaining)
+            except asyncio.TimeoutError:
+                # No activity for the full window — loop re-checks and
+                # interrupts above.
+                pass
+
+    def _read_head_commit(self) -> str | None:
+        """Resolve HEAD to a sha by reading .git files directly.
 
-    def _get_latest_commit_hash(self) -> str | None:
-        """Get the latest commit hash from the project."""
+        Avoids a fork+exec per feature. Returns None when the layout is
+        not the simple loose-ref case (packed refs, worktree gitfile), in
+        which case the caller falls back to a git subprocess.
+        """
+        git_dir = self.config.project_dir / ".git"
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            return None
+        if head.startswith("ref: "):
+            try:
+                return (git_dir / head[5:]).read_text().strip() or None
+            except OSError:
+                return None
+        # Detached HEAD stores the sha inline.
+        return head or None
+
+    async def _get_latest_commit_hash(self) -> str | None:
+        """Get the latest commit hash from the project.
+
+        Resolves HEAD in-process via pygit2 when available, else reads
+        the ref file directly (two tiny local reads, no subprocess);
+        falls back to an async `git log` when the ref is packed or
+        otherwise unreadable.
+        """
+        if self._repo is not None:
+            try:
+                return str(self._repo.head.target)[:12]
+            except Exception:
+                pass
+        sha = self._read_head_commit()
+        if sha:
+            return sha[:12]
         try:
-            result = subprocess.run(
-                ["git", "log", "--format=%H", "-1"],
+            proc = await asyncio.create_subprocess_exec(
+                "git", "log", "--format=%H", "-1",
                 cwd=self.config.project_dir,
-                capture_output=True,
-                text=True,
-                timeout=10,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            if result.returncode == 0:
-                return result.stdout.strip()[:12]
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10)
+            if proc.returncode == 0:
+                return stdout.decode().strip()[:12]
         except Exception:
             pass
         return None
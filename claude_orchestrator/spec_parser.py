@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 from pathlib import Path
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from claude_agent_sdk import ClaudeAgentOptions, ResultMessage, query
 
@@ -32,6 +34,10 @@ with passes set to false.
 
 
 class ParsedFeature(BaseModel):
+    # Write-once output records: frozen skips mutable-field bookkeeping,
+    # and extra='ignore' tolerates additional keys in structured output.
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: int
     name: str
     passes: bool = False
@@ -39,17 +45,54 @@ class ParsedFeature(BaseModel):
 
 
 class ParsedSpec(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     features: list[ParsedFeature]
 
 
+# Validates a whole cached list in one call into pydantic's core.
+_FEATURE_LIST = TypeAdapter(list[ParsedFeature])
+
+
+def _cache_path(spec_content: str, model: str) -> Path:
+    """Cache file for a given spec text + model (content-addressed)."""
+    cache_dir = Path(
+        os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    ) / "claude-orchestrator"
+    key = hashlib.sha256(f"{model}\n{spec_content}".encode()).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def _write_features_json(output_path: Path, data: list[dict]) -> None:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
 async def parse_spec(
     spec_path: Path,
     output_path: Path,
     model: str = "opus",
 ) -> list[ParsedFeature]:
-    """Parse a spec.md into features.json using Claude with structured output."""
+    """Parse a spec.md into features.json using Claude with structured output.
+
+    Results are cached under ~/.cache/claude-orchestrator keyed by the
+    spec content and model, so re-running against a byte-identical spec
+    skips the Claude call entirely.
+    """
     spec_content = spec_path.read_text()
 
+    cache_path = _cache_path(spec_content, model)
+    try:
+        cached = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        cached = None
+    if cached is not None:
+        features = _FEATURE_LIST.validate_python(cached)
+        _write_features_json(output_path, cached)
+        return features
+
     schema = {
         "type": "object",
         "properties": {
@@ -91,9 +134,13 @@ async def parse_spec(
 
     # Write features.json
     data = [f.model_dump() for f in features]
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    _write_features_json(output_path, data)
+
+    # Populate the content-addressed cache; best-effort only.
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(data))
+    except OSError:
+        pass
 
     return features
@@ -3,10 +3,21 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
+from collections import deque
 from pathlib import Path
 
 from .models import Feature, FeatureResult, FeatureStatus, ProgressEntry
 
+try:
+    import orjson  # C-implemented serializer; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+_loads = json.loads if orjson is None else orjson.loads
+
 
 class StateManager:
     """Manages features.json and progress.txt with atomic writes and legacy compatibility."""
@@ -14,12 +25,36 @@ class StateManager:
     def __init__(self, features_path: Path, progress_path: Path):
         self.features_path = features_path
         self.progress_path = progress_path
+        # Append-only journal of state transitions. mark_feature appends a
+        # single line here; flush() folds everything into features.json and
+        # clears it. Crash recovery replays it on load.
+        self.journal_path = features_path.with_suffix(".jsonl")
         self._features: list[Feature] = []
+        self._by_id: dict[int, Feature] = {}
+        self._pending: deque[Feature] = deque()
+        # When defer_saves() has been called, save_features only marks the
+        # state dirty; flush() performs the actual write. Default is
+        # immediate writes, matching direct StateManager use.
+        self._defer_saves = False
+        self._dirty = False
+        # Guards the dirty check-and-clear plus the snapshot write: flush()
+        # runs both on executor threads (the orchestrator's background
+        # flusher) and synchronously at cleanup, and two concurrent
+        # _write_features calls would interleave on the same tmp file.
+        self._write_lock = threading.Lock()
+        self._progress_dir_ready = False
+        # Progress log handle, opened on first append and kept for the
+        # manager's lifetime; see close().
+        self._progress_fh = None
+        # Rendered header timestamp, cached per second: bursts of appends
+        # (parallel mode) share one localtime + format.
+        self._stamp_second = -1
+        self._stamp = ""
 
     def load_features(self) -> list[Feature]:
         """Load features.json, converting legacy format if needed."""
-        with open(self.features_path) as f:
-            raw = json.load(f)
+        with open(self.features_path, "rb") as f:
+            raw = _loads(f.read())
 
         features = []
         for item in raw:
@@ -36,6 +71,7 @@ class StateManager:
                 name=item["name"],
                 passes=item.get("passes", False),
                 steps=item.get("steps", []),
+                depends_on=item.get("depends_on", []),
                 status=status,
                 attempts=item.get("attempts", 0),
                 last_error=item.get("last_error"),
@@ -44,84 +80,237 @@ class StateManager:
             ))
 
         self._features = features
+        self._by_id = {f.id: f for f in features}
+        self._replay_journal(features)
+        # Candidates for get_next_feature, consumed from the front as
+        # features complete so each lookup is amortized O(1) instead of
+        # rescanning the whole list.
+        self._pending = deque(
+            f for f in features
+            if not f.passes and f.status != FeatureStatus.SKIPPED
+        )
         return features
 
-    def save_features(self) -> None:
+    def _replay_journal(self, features: list[Feature]) -> None:
+        """Fold journalled transitions into a freshly loaded feature list.
+
+        Non-empty only after a crash or kill between a mark_feature and
+        the next flush; normal shutdown compacts the journal away.
+        """
+        try:
+            with open(self.journal_path) as jf:
+                lines = jf.readlines()
+        except OSError:
+            return
+        by_id = self._by_id
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            rec = _loads(line)
+            f = by_id.get(rec["id"])
+            if f is None:
+                continue
+            f.passes = rec["passes"]
+            f.status = FeatureStatus(rec["status"])
+            f.attempts = rec["attempts"]
+            f.last_error = rec.get("last_error")
+            f.last_session_id = rec.get("last_session_id")
+            f.commit_hash = rec.get("commit_hash")
+        if lines:
+            # Snapshot is stale relative to the journal; next flush compacts.
+            self._dirty = True
+
+    def defer_saves(self) -> None:
+        """Coalesce save_features calls into a dirty flag (see flush)."""
+        self._defer_saves = True
+
+    def flush(self) -> None:
+        """Write features.json if there are unsaved changes.
+
+        Also compacts the journal: once the snapshot includes every
+        transition, the journal has nothing left to replay.
+        """
+        with self._write_lock:
+            if self._dirty:
+                self._dirty = False
+                self._write_features()
+                self.journal_path.unlink(missing_ok=True)
+
+    def save_features(self, force: bool = False) -> None:
+        """Persist features.json, or mark dirty when saves are deferred.
+
+        Callers signal that feature state changed; with deferred saves on
+        that just sets the dirty flag, and with them off the write is
+        skipped when nothing is dirty unless force=True (external
+        mutations of Feature objects can't be observed here).
+        """
+        if self._defer_saves:
+            self._dirty = True
+            return
+        with self._write_lock:
+            if not force and not self._dirty:
+                return
+            self._dirty = False
+            self._write_features()
+            self.journal_path.unlink(missing_ok=True)
+
+    def _write_features(self) -> None:
         """Atomically write features.json (write to tmp, then rename).
 
         Preserves legacy-compatible format with optional extended fields.
         """
         tmp_path = self.features_path.with_suffix(".json.tmp")
-        data = []
-        for f in self._features:
-            entry: dict = {
+        # One dict literal per feature (extended fields merged in only when
+        # non-default) so the dict is sized once instead of grown key by key.
+        data = [
+            {
                 "id": f.id,
                 "name": f.name,
                 "passes": f.passes,
                 "steps": f.steps,
+                **({"depends_on": f.depends_on} if f.depends_on else {}),
+                **({"attempts": f.attempts} if f.attempts > 0 else {}),
+                **({"last_error": f.last_error} if f.last_error else {}),
+                **(
+                    {"last_session_id": f.last_session_id}
+                    if f.last_session_id
+                    else {}
+                ),
+                **({"commit_hash": f.commit_hash} if f.commit_hash else {}),
+                **(
+                    {"status": f.status.value}
+                    if f.status not in (FeatureStatus.PENDING, FeatureStatus.PASSED)
+                    else {}
+                ),
             }
-            # Include extended fields only when non-default
-            if f.attempts > 0:
-                entry["attempts"] = f.attempts
-            if f.last_error:
-                entry["last_error"] = f.last_error
-            if f.last_session_id:
-                entry["last_session_id"] = f.last_session_id
-            if f.commit_hash:
-                entry["commit_hash"] = f.commit_hash
-            if f.status not in (FeatureStatus.PENDING, FeatureStatus.PASSED):
-                entry["status"] = f.status.value
-            data.append(entry)
-
-        with open(tmp_path, "w") as f:
-            json.dump(data, f, indent=2)
-            f.write("\n")
-        tmp_path.rename(self.features_path)
+            for f in self._features
+        ]
+
+        # Keep 2-space indentation either way: features.json is authored
+        # and inspected by hand, not just read back by the loader.
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n"
+        else:
+            payload = (json.dumps(data, indent=2) + "\n").encode()
+        # Raw fd path: one write + fsync, then an atomic replace, with no
+        # buffered-I/O layer in between.
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.features_path)
 
     def get_next_feature(self, start_from: int | None = None) -> Feature | None:
-        """Return the first incomplete, non-skipped feature at or after start_from."""
-        for f in self._features:
-            if start_from is not None and f.id < start_from:
+        """Return the first incomplete, non-skipped feature at or after start_from.
+
+        Consumes completed (and below-start_from) entries from the pending
+        queue, so callers should pass a consistent start_from across a run,
+        as the orchestrator does. A failed feature stays at the front until
+        it passes or is skipped, preserving retry semantics.
+        """
+        pending = self._pending
+        while pending:
+            f = pending[0]
+            if (
+                f.passes
+                or f.status == FeatureStatus.SKIPPED
+                or (start_from is not None and f.id < start_from)
+            ):
+                pending.popleft()
                 continue
-            if not f.passes and f.status != FeatureStatus.SKIPPED:
-                return f
+            return f
         return None
 
     def mark_feature(self, feature_id: int, result: FeatureResult) -> None:
-        """Update a feature's state based on execution result."""
-        for f in self._features:
-            if f.id == feature_id:
-                f.attempts += 1
-                f.last_session_id = result.session_id
-                if result.success:
-                    f.passes = True
-                    f.status = FeatureStatus.PASSED
-                    f.commit_hash = result.commit_hash
-                    f.last_error = None
-                else:
-                    f.status = FeatureStatus.FAILED
-                    f.last_error = result.error
-                break
-        self.save_features()
-
-    def append_progress(self, entry: ProgressEntry) -> None:
-        """Append a session summary to the progress log."""
-        self.progress_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.progress_path, "a") as f:
-            header = (
-                f"\n=== Feature #{entry.feature_id}: {entry.feature_name} "
-                f"-- {entry.status.value} -- "
-                f"{entry.timestamp.strftime('%Y-%m-%d %H:%M')} ==="
+        """Update a feature's state based on execution result.
+
+        Only marks the state dirty; call flush() to persist. This keeps a
+        run from rewriting features.json once per state transition.
+        """
+        f = self._by_id.get(feature_id)
+        if f is not None:
+            f.attempts += 1
+            f.last_session_id = result.session_id
+            if result.success:
+                f.passes = True
+                f.status = FeatureStatus.PASSED
+                f.commit_hash = result.commit_hash
+                f.last_error = None
+            else:
+                f.status = FeatureStatus.FAILED
+                f.last_error = result.error
+            self._journal(f)
+        self._dirty = True
+
+    def _journal(self, f: Feature) -> None:
+        """Append one compact transition record (a single write, no rename)."""
+        rec: dict = {
+            "id": f.id,
+            "passes": f.passes,
+            "status": f.status.value,
+            "attempts": f.attempts,
+        }
+        if f.last_error:
+            rec["last_error"] = f.last_error
+        if f.last_session_id:
+            rec["last_session_id"] = f.last_session_id
+        if f.commit_hash:
+            rec["commit_hash"] = f.commit_hash
+        with open(self.journal_path, "a") as jf:
+            jf.write(json.dumps(rec, separators=(",", ":")) + "\n")
+
+    def append_progress(self, entry: ProgressEntry | None = None, **fields) -> None:
+        """Append a session summary to the progress log.
+
+        Accepts either a prebuilt ProgressEntry or the entry's fields as
+        keyword arguments; in the latter case the entry (and its default
+        timestamp) is only constructed here, at write time.
+        """
+        if entry is None:
+            entry = ProgressEntry(**fields)
+        if not self._progress_dir_ready:
+            self.progress_path.parent.mkdir(parents=True, exist_ok=True)
+            self._progress_dir_ready = True
+        # Assemble the whole record and write it once: one syscall per
+        # entry instead of one per line.
+        # Fixed ASCII format: f-string over the struct_time fields skips
+        # strftime's locale-aware formatter; cached per second.
+        sec = int(entry.timestamp)
+        if sec != self._stamp_second:
+            self._stamp_second = sec
+            lt = time.localtime(sec)
+            self._stamp = (
+                f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d} "
+                f"{lt.tm_hour:02d}:{lt.tm_min:02d}"
             )
-            f.write(f"{header}\n")
-            f.write(f"{entry.summary}\n")
-            if entry.commit_hash:
-                f.write(f"- Commit: {entry.commit_hash}\n")
-            if entry.session_id:
-                f.write(f"- Session: {entry.session_id}\n")
-            if entry.error:
-                f.write(f"- Error: {entry.error}\n")
-            f.write("\n")
+        stamp = self._stamp
+        parts = [
+            f"\n=== Feature #{entry.feature_id}: {entry.feature_name} "
+            f"-- {entry.status.value} -- {stamp} ===\n",
+            f"{entry.summary}\n",
+        ]
+        if entry.commit_hash:
+            parts.append(f"- Commit: {entry.commit_hash}\n")
+        if entry.session_id:
+            parts.append(f"- Session: {entry.session_id}\n")
+        if entry.error:
+            parts.append(f"- Error: {entry.error}\n")
+        parts.append("\n")
+        if self._progress_fh is None:
+            self._progress_fh = open(self.progress_path, "a", buffering=8192)
+        self._progress_fh.write("".join(parts))
+        # Flush per entry: the log is tailed by humans (and read back by
+        # worker prompts), so entries must be visible as they happen.
+        self._progress_fh.flush()
+
+    def close(self) -> None:
+        """Release the progress-log handle (flushing any buffered output)."""
+        if self._progress_fh is not None:
+            self._progress_fh.close()
+            self._progress_fh = None
 
     def get_progress_summary(self) -> str:
         """Return completion stats for display."""
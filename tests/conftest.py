@@ -3,26 +3,49 @@
 from __future__ import annotations
 
 import json
+import shutil
 from pathlib import Path
 
 import pytest
 
 
-@pytest.fixture
-def tmp_project(tmp_path: Path) -> Path:
-    """Create a minimal project directory with features.json and progress.txt."""
+@pytest.fixture(autouse=True)
+def _no_git(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stub the runner's commit lookup so tests never touch git.
+
+    Test projects are plain tmp dirs, so the real lookup would fall back
+    to spawning `git log` (and failing) once per mocked feature run.
+    """
+
+    async def _fake_commit_hash(self) -> str:
+        return "deadbeef"
+
+    monkeypatch.setattr(
+        "claude_orchestrator.runner.FeatureRunner._get_latest_commit_hash",
+        _fake_commit_hash,
+    )
+
+
+@pytest.fixture(scope="session")
+def _project_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Materialize the canonical project files once per test session."""
+    template = tmp_path_factory.mktemp("project-template")
     features = [
         {"id": 1, "name": "Add header component", "passes": True, "steps": ["Create header", "Style it"]},
         {"id": 2, "name": "Add footer component", "passes": False, "steps": ["Create footer", "Add links"]},
         {"id": 3, "name": "Add navigation", "passes": False, "steps": ["Create nav", "Add routes", "Style"]},
     ]
-    features_path = tmp_path / "features.json"
-    features_path.write_text(json.dumps(features, indent=2) + "\n")
+    (template / "features.json").write_text(json.dumps(features, indent=2) + "\n")
+    (template / "progress.txt").write_text("=== Initial setup ===\nProject initialized.\n")
+    return template
 
-    progress_path = tmp_path / "progress.txt"
-    progress_path.write_text("=== Initial setup ===\nProject initialized.\n")
 
-    return tmp_path
+@pytest.fixture
+def tmp_project(_project_template: Path, tmp_path: Path) -> Path:
+    """A per-test copy of the template project (copy beats re-serializing)."""
+    project = tmp_path / "project"
+    shutil.copytree(_project_template, project)
+    return project
 
 
 @pytest.fixture
@@ -30,6 +53,16 @@ def legacy_features_path(tmp_project: Path) -> Path:
     return tmp_project / "features.json"
 
 
+@pytest.fixture
+def loaded_state(legacy_features_path: Path, progress_path: Path):
+    """A StateManager with the template features already loaded."""
+    from claude_orchestrator.state import StateManager
+
+    state = StateManager(legacy_features_path, progress_path)
+    state.load_features()
+    return state
+
+
 @pytest.fixture
 def progress_path(tmp_project: Path) -> Path:
     return tmp_project / "progress.txt"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import logging
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -34,6 +35,22 @@ def config_with_project(tmp_path: Path) -> OrchestratorConfig:
     )
 
 
+def _parallel_config(tmp_path: Path, features: list[dict]) -> OrchestratorConfig:
+    """Config for a tmp project running the given features two at a time."""
+    (tmp_path / "features.json").write_text(json.dumps(features, indent=2) + "\n")
+    (tmp_path / "progress.txt").write_text("")
+
+    return OrchestratorConfig(
+        project_dir=tmp_path,
+        features_file=Path("features.json"),
+        progress_file=Path("progress.txt"),
+        max_retries=2,
+        max_parallel_features=2,
+        structured_log=False,
+        dry_run=False,
+    )
+
+
 class TestDryRun:
     @pytest.mark.asyncio
     async def test_dry_run_no_execution(self, config_with_project: OrchestratorConfig, capsys):
@@ -95,3 +112,91 @@ class TestMainLoop:
             await orch.run()
 
         assert call_count == 1  # Only feature 2
+
+
+class TestParallelScheduler:
+    @pytest.mark.asyncio
+    async def test_dependency_ordering(self, tmp_path: Path):
+        """A feature starts only after everything it depends_on has passed."""
+        config = _parallel_config(tmp_path, [
+            {"id": 1, "name": "Base", "passes": False, "steps": []},
+            {"id": 2, "name": "Dependent", "passes": False, "steps": [], "depends_on": [1]},
+        ])
+        orch = Orchestrator(config)
+
+        started: list[int] = []
+
+        async def mock_run_feature(feature):
+            started.append(feature.id)
+            return FeatureResult(
+                feature_id=feature.id,
+                success=True,
+                duration_seconds=1.0,
+            )
+
+        with patch.object(orch.runner, "run_feature", side_effect=mock_run_feature):
+            await orch.run()
+
+        # Without the dependency both would be scheduled in the same pass.
+        assert started == [1, 2]
+
+        features = json.loads((tmp_path / "features.json").read_text())
+        assert all(f["passes"] for f in features)
+
+    @pytest.mark.asyncio
+    async def test_unmet_dependency_reported(self, tmp_path: Path, caplog):
+        """A dependency that can never pass is reported, not waited on."""
+        config = _parallel_config(tmp_path, [
+            {"id": 1, "name": "Base", "passes": False, "steps": []},
+            {"id": 2, "name": "Orphan", "passes": False, "steps": [], "depends_on": [99]},
+        ])
+        orch = Orchestrator(config)
+
+        async def mock_run_feature(feature):
+            return FeatureResult(
+                feature_id=feature.id,
+                success=True,
+                duration_seconds=1.0,
+            )
+
+        with (
+            patch.object(orch.runner, "run_feature", side_effect=mock_run_feature) as mocked,
+            caplog.at_level(logging.ERROR, logger="orchestrator"),
+        ):
+            await orch.run()
+
+        assert mocked.call_count == 1  # Only feature 1
+        assert "No runnable features" in caplog.text
+
+        features = json.loads((tmp_path / "features.json").read_text())
+        assert next(f for f in features if f["id"] == 2)["passes"] is False
+
+    @pytest.mark.asyncio
+    async def test_failure_blocks_dependents(self, tmp_path: Path):
+        """A failed feature becomes unrunnable and its dependents never start."""
+        config = _parallel_config(tmp_path, [
+            {"id": 1, "name": "Base", "passes": False, "steps": []},
+            {"id": 2, "name": "Dependent", "passes": False, "steps": [], "depends_on": [1]},
+        ])
+        orch = Orchestrator(config)
+
+        started: list[int] = []
+
+        async def mock_run_feature(feature):
+            started.append(feature.id)
+            return FeatureResult(
+                feature_id=feature.id,
+                success=False,
+                error="user denied permission",  # non-retriable: one attempt
+                duration_seconds=1.0,
+            )
+
+        with patch.object(orch.runner, "run_feature", side_effect=mock_run_feature):
+            await orch.run()
+
+        assert started == [1]
+
+        features = json.loads((tmp_path / "features.json").read_text())
+        f1 = next(f for f in features if f["id"] == 1)
+        assert f1["passes"] is False
+        assert f1["status"] == "failed"
@@ -13,9 +13,8 @@ from claude_orchestrator.state import StateManager
 
 
 class TestLoadFeatures:
-    def test_loads_legacy_format(self, legacy_features_path: Path, progress_path: Path):
-        state = StateManager(legacy_features_path, progress_path)
-        features = state.load_features()
+    def test_loads_legacy_format(self, loaded_state: StateManager):
+        features = loaded_state._features
 
         assert len(features) == 3
         assert features[0].id == 1
@@ -25,28 +24,21 @@ class TestLoadFeatures:
         assert features[1].passes is False
         assert features[1].status == FeatureStatus.PENDING
 
-    def test_loads_steps(self, legacy_features_path: Path, progress_path: Path):
-        state = StateManager(legacy_features_path, progress_path)
-        features = state.load_features()
+    def test_loads_steps(self, loaded_state: StateManager):
+        features = loaded_state._features
 
         assert features[0].steps == ["Create header", "Style it"]
         assert len(features[2].steps) == 3
 
 
 class TestGetNextFeature:
-    def test_returns_first_incomplete(self, legacy_features_path: Path, progress_path: Path):
-        state = StateManager(legacy_features_path, progress_path)
-        state.load_features()
-
-        nxt = state.get_next_feature()
+    def test_returns_first_incomplete(self, loaded_state: StateManager):
+        nxt = loaded_state.get_next_feature()
         assert nxt is not None
         assert nxt.id == 2
 
-    def test_respects_start_from(self, legacy_features_path: Path, progress_path: Path):
-        state = StateManager(legacy_features_path, progress_path)
-        state.load_features()
-
-        nxt = state.get_next_feature(start_from=3)
+    def test_respects_start_from(self, loaded_state: StateManager):
+        nxt = loaded_state.get_next_feature(start_from=3)
         assert nxt is not None
         assert nxt.id == 3
 
@@ -63,25 +55,19 @@ class TestGetNextFeature:
         state.load_features()
         assert state.get_next_feature() is None
 
-    def test_skips_skipped_features(self, legacy_features_path: Path, progress_path: Path):
-        state = StateManager(legacy_features_path, progress_path)
-        features = state.load_features()
-
+    def test_skips_skipped_features(self, loaded_state: StateManager):
         # Mark feature 2 as skipped
-        features[1].status = FeatureStatus.SKIPPED
-        state.save_features()
-        state.load_features()
+        loaded_state._features[1].status = FeatureStatus.SKIPPED
+        loaded_state.save_features(force=True)
+        loaded_state.load_features()
 
-        nxt = state.get_next_feature()
+        nxt = loaded_state.get_next_feature()
         assert nxt is not None
         assert nxt.id == 3
 
 
 class TestMarkFeature:
-    def test_marks_success(self, legacy_features_path: Path, progress_path: Path):
-        state = StateManager(legacy_features_path, progress_path)
-        state.load_features()
-
+    def test_marks_success(self, loaded_state: StateManager):
         result = FeatureResult(
             feature_id=2,
             success=True,
@@ -89,31 +75,30 @@ class TestMarkFeature:
             commit_hash="abc123",
             duration_seconds=60.0,
         )
-        state.mark_feature(2, result)
+        loaded_state.mark_feature(2, result)
+        loaded_state.flush()
 
         # Reload and verify
-        state.load_features()
-        f2 = next(f for f in state._features if f.id == 2)
+        loaded_state.load_features()
+        f2 = next(f for f in loaded_state._features if f.id == 2)
         assert f2.passes is True
         assert f2.status == FeatureStatus.PASSED
         assert f2.attempts == 1
         assert f2.commit_hash == "abc123"
         assert f2.last_session_id == "sess-123"
 
-    def test_marks_failure(self, legacy_features_path: Path, progress_path: Path):
-        state = StateManager(legacy_features_path, progress_path)
-        state.load_features()
-
+    def test_marks_failure(self, loaded_state: StateManager):
         result = FeatureResult(
             feature_id=2,
             success=False,
             error="Build failed",
             duration_seconds=30.0,
         )
-        state.mark_feature(2, result)
+        loaded_state.mark_feature(2, result)
+        loaded_state.flush()
 
-        state.load_features()
-        f2 = next(f for f in state._features if f.id == 2)
+        loaded_state.load_features()
+        f2 = next(f for f in loaded_state._features if f.id == 2)
         assert f2.passes is False
         assert f2.status == FeatureStatus.FAILED
         assert f2.last_error == "Build failed"
@@ -121,31 +106,24 @@ class TestMarkFeature:
 
 
 class TestSaveFeatures:
-    def test_preserves_legacy_format(self, legacy_features_path: Path, progress_path: Path):
-        state = StateManager(legacy_features_path, progress_path)
-        state.load_features()
-        state.save_features()
+    def test_preserves_legacy_format(self, loaded_state: StateManager):
+        loaded_state.save_features(force=True)
 
-        with open(legacy_features_path) as f:
+        with open(loaded_state.features_path) as f:
             data = json.load(f)
 
-        # Legacy fields always present
-        assert all("id" in item for item in data)
-        assert all("name" in item for item in data)
-        assert all("passes" in item for item in data)
-        assert all("steps" in item for item in data)
+        # Legacy fields always present (one pass over the list)
+        required = {"id", "name", "passes", "steps"}
+        assert all(required <= item.keys() for item in data)
 
         # Extended fields absent when default
-        assert "attempts" not in data[0]
-        assert "last_error" not in data[0]
+        assert not any(k in data[0] for k in ("attempts", "last_error"))
 
-    def test_atomic_write(self, legacy_features_path: Path, progress_path: Path):
+    def test_atomic_write(self, loaded_state: StateManager):
         """Verify no .tmp file remains after save."""
-        state = StateManager(legacy_features_path, progress_path)
-        state.load_features()
-        state.save_features()
+        loaded_state.save_features(force=True)
 
-        tmp = legacy_features_path.with_suffix(".json.tmp")
+        tmp = loaded_state.features_path.with_suffix(".json.tmp")
         assert not tmp.exists()
 
 
@@ -172,9 +150,6 @@ class TestAppendProgress:
 
 
 class TestGetProgressSummary:
-    def test_summary(self, legacy_features_path: Path, progress_path: Path):
-        state = StateManager(legacy_features_path, progress_path)
-        state.load_features()
-
-        summary = state.get_progress_summary()
+    def test_summary(self, loaded_state: StateManager):
+        summary = loaded_state.get_progress_summary()
         assert "1/3 complete" in summary